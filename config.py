@@ -19,7 +19,11 @@ NOTES_WINDOW_MIN_HEIGHT = 400
 
 # Animation settings
 ANIMATION_DURATION = 350  # milliseconds
+# Shorter duration used once animation frames are measured to be slow
+ANIMATION_DURATION_SLOW = 150  # milliseconds
+SLOW_FRAME_THRESHOLD = 33  # mean milliseconds per frame (~30 fps)
 ANIMATION_EASING = "OutCubic"  # QEasingCurve type
+DRAG_UPDATE_INTERVAL = 16  # milliseconds, coalesce drag moves to ~60 Hz
 
 # Button appearance
 BUTTON_OPACITY = 0.75
@@ -39,9 +43,16 @@ COLOR_HOVER_GLOW = (0, 120, 215, 100)
 # Data directory
 DATA_DIR = Path.home() / ".notes_overlay"
 NOTES_FILE = DATA_DIR / "notes.json"
+TRAY_ICON_CACHE = DATA_DIR / "tray_icon.png"  # Rendered fallback tray icon
+SAVE_DEBOUNCE_INTERVAL = 1000  # milliseconds of inactivity before notes are written
+SAVE_MAX_DELAY = 5000  # milliseconds continuous typing may postpone a save
 
 # Ensure data directory exists
 DATA_DIR.mkdir(exist_ok=True)
 
 # Fullscreen detection
-FULLSCREEN_CHECK_INTERVAL = 500  # milliseconds
\ No newline at end of file
+# Poll interval used only when the WinEvent hook can't be installed. Kept at
+# 2 s or more so the timer doesn't keep the CPU out of low-power idle.
+FULLSCREEN_CHECK_INTERVAL = 2000  # milliseconds
+FULLSCREEN_FALLBACK_INTERVAL = 5000  # milliseconds, safety-net poll when the WinEvent hook is active
+FULLSCREEN_SUSPENDED_INTERVAL = 2000  # milliseconds, minimum poll interval while a fullscreen app is active
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Listens for Windows display/settings change messages to invalidate cached geometry.
+"""
+from ctypes import wintypes
+from typing import Callable
+from PyQt6.QtCore import QAbstractNativeEventFilter
+
+WM_SETTINGCHANGE = 0x001A
+WM_DISPLAYCHANGE = 0x007E
+WM_DPICHANGED = 0x02E0
+
+_WATCHED_MESSAGES = (WM_SETTINGCHANGE, WM_DISPLAYCHANGE, WM_DPICHANGED)
+
+
+class DisplayChangeFilter(QAbstractNativeEventFilter):
+    """Native event filter that reports resolution, DPI and work-area changes."""
+    
+    def __init__(self, on_display_change: Callable[[], None]):
+        super().__init__()
+        self.on_display_change = on_display_change
+    
+    def nativeEventFilter(self, event_type, message):
+        """Inspect raw Windows messages; never consumes them."""
+        if event_type == b"windows_generic_MSG" and message:
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message in _WATCHED_MESSAGES:
+                self.on_display_change()
+        return False, 0
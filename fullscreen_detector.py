@@ -1,73 +1,295 @@
 """
 Detects when fullscreen applications are active to hide the overlay.
 """
-import win32gui
-import win32con
-import win32api
+import ctypes
+import logging
+import os
+from collections import OrderedDict
+from ctypes import wintypes
 from typing import Callable, Optional
 import config
 
+logger = logging.getLogger(__name__)
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+shell32 = ctypes.WinDLL("shell32")
+
+# Win32 constants (winuser.h)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+WINEVENT_OUTOFCONTEXT = 0x0000
+SW_SHOWMAXIMIZED = 3
+GWL_STYLE = -16
+WS_CAPTION = 0x00C00000
+SM_CXSCREEN = 0
+SM_CYSCREEN = 1
+
+# QUERY_USER_NOTIFICATION_STATE values (shellapi.h)
+QUNS_BUSY = 2
+QUNS_RUNNING_D3D_FULL_SCREEN = 3
+QUNS_PRESENTATION_MODE = 4
+_FULLSCREEN_STATES = (QUNS_BUSY, QUNS_RUNNING_D3D_FULL_SCREEN, QUNS_PRESENTATION_MODE)
+
+
+class WINDOWPLACEMENT(ctypes.Structure):
+    _fields_ = [
+        ("length", wintypes.UINT),
+        ("flags", wintypes.UINT),
+        ("showCmd", wintypes.UINT),
+        ("ptMinPosition", wintypes.POINT),
+        ("ptMaxPosition", wintypes.POINT),
+        ("rcNormalPosition", wintypes.RECT),
+    ]
+
+
+user32.GetForegroundWindow.restype = wintypes.HWND
+user32.GetForegroundWindow.argtypes = []
+user32.GetWindowRect.restype = wintypes.BOOL
+user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+user32.GetWindowPlacement.restype = wintypes.BOOL
+user32.GetWindowPlacement.argtypes = [wintypes.HWND, ctypes.POINTER(WINDOWPLACEMENT)]
+user32.GetWindowLongW.restype = wintypes.LONG
+user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.GetSystemMetrics.restype = ctypes.c_int
+user32.GetSystemMetrics.argtypes = [ctypes.c_int]
+user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.UnhookWinEvent.restype = wintypes.BOOL
+user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+shell32.SHQueryUserNotificationState.restype = ctypes.c_long
+shell32.SHQueryUserNotificationState.argtypes = [ctypes.POINTER(ctypes.c_int)]
+
+# Pixels a window may be off from the screen edges and still count as covering it
+_COVER_TOLERANCE = 10
+
+# Number of foreground windows whose screen-coverage result is remembered
+_HWND_CACHE_SIZE = 64
+
+# Reused out-parameters so polling doesn't allocate per call
+_rect = wintypes.RECT()
+_placement = WINDOWPLACEMENT()
+_placement.length = ctypes.sizeof(WINDOWPLACEMENT)
+_pid = wintypes.DWORD()
+
+WinEventProcType = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+# Cached (width, height) of the primary screen; only changes on WM_DISPLAYCHANGE
+_screen_size = None
+
+
+def get_screen_size() -> tuple:
+    """Get the primary screen size, querying the system only once."""
+    global _screen_size
+    if _screen_size is None:
+        _screen_size = (
+            user32.GetSystemMetrics(SM_CXSCREEN),
+            user32.GetSystemMetrics(SM_CYSCREEN),
+        )
+    return _screen_size
+
+
+def invalidate_screen_size() -> None:
+    """Forget the cached screen size (call on display changes)."""
+    global _screen_size
+    _screen_size = None
+
 
 class FullscreenDetector:
     """Monitors for fullscreen applications and notifies callbacks."""
     
+    # Attributes read on every poll/WinEvent; slots avoid per-access dict lookups
+    __slots__ = (
+        "on_fullscreen_change",
+        "_is_fullscreen",
+        "_last_foreground",
+        "_last_rect",
+        "_hwnd_cache",
+        "_own_pid",
+        "_hook",
+        "_win_event_proc",
+    )
+    
     def __init__(self, on_fullscreen_change: Optional[Callable[[bool], None]] = None):
         self.on_fullscreen_change = on_fullscreen_change
         self._is_fullscreen = False
         self._last_foreground = None
+        self._last_rect = None
+        # hwnd -> (window rect, screen size, covers screen), least recently used first
+        self._hwnd_cache = OrderedDict()
+        self._own_pid = os.getpid()
+        self._hook = None
+        # Keep a reference to the ctypes callback so it isn't garbage collected
+        self._win_event_proc = WinEventProcType(self._on_win_event)
+        self._install_hook()
     
-    def check_fullscreen(self) -> bool:
+    def _install_hook(self) -> None:
+        """
+        Register for foreground/move-size-end notifications.
+        The hook is out-of-context, so callbacks are delivered through the
+        GUI thread's message loop (which Qt already pumps).
+        """
+        self._hook = user32.SetWinEventHook(
+            EVENT_SYSTEM_FOREGROUND,
+            EVENT_SYSTEM_MOVESIZEEND,
+            0,
+            self._win_event_proc,
+            0,
+            0,
+            WINEVENT_OUTOFCONTEXT,
+        ) or None
+    
+    def stop(self) -> None:
+        """Unregister the WinEvent hook."""
+        if self._hook:
+            user32.UnhookWinEvent(self._hook)
+            self._hook = None
+    
+    def is_event_driven(self) -> bool:
+        """Whether fullscreen changes are pushed by the WinEvent hook."""
+        return self._hook is not None
+    
+    def _on_win_event(self, hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        """WinEvent callback: re-check only on real foreground/location changes."""
+        if event == EVENT_SYSTEM_FOREGROUND:
+            if hwnd == self._last_foreground:
+                return
+        elif event != EVENT_SYSTEM_MOVESIZEEND:
+            # The hook range also covers menu/capture events we don't care about
+            return
+        self.check_fullscreen(force=True)
+    
+    def check_fullscreen(self, force: bool = False) -> bool:
         """
         Check if the current foreground window is fullscreen.
         Returns True if fullscreen, False otherwise.
+        Unless force is set, the full probe is skipped while the foreground
+        window and its rectangle are unchanged since the last check.
+        Failed Win32 calls (e.g. a window closing mid-check) keep the
+        previous state instead of raising.
         """
-        try:
-            hwnd = win32gui.GetForegroundWindow()
-            if hwnd == 0:
-                return False
-            
-            # Check if window is maximized
-            placement = win32gui.GetWindowPlacement(hwnd)
-            if placement[1] == win32con.SW_SHOWMAXIMIZED:
-                # Check if it covers the entire screen
-                window_rect = win32gui.GetWindowRect(hwnd)
-                screen_width = win32api.GetSystemMetrics(win32con.SM_CXSCREEN)
-                screen_height = win32api.GetSystemMetrics(win32con.SM_CYSCREEN)
-                
-                # Check if window covers entire screen (with small tolerance)
-                tolerance = 10
-                covers_screen = (
-                    abs(window_rect[0]) <= tolerance and
-                    abs(window_rect[1]) <= tolerance and
-                    abs(window_rect[2] - screen_width) <= tolerance and
-                    abs(window_rect[3] - screen_height) <= tolerance
-                )
-                
-                # Also check if window has no title bar (common in fullscreen apps)
-                style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-                has_title_bar = bool(style & win32con.WS_CAPTION)
-                
-                is_fullscreen = covers_screen or not has_title_bar
-                
-                # Notify if state changed
-                if is_fullscreen != self._is_fullscreen:
-                    self._is_fullscreen = is_fullscreen
-                    if self.on_fullscreen_change:
-                        self.on_fullscreen_change(is_fullscreen)
-                
-                return is_fullscreen
-            else:
-                if self._is_fullscreen:
-                    self._is_fullscreen = False
-                    if self.on_fullscreen_change:
-                        self.on_fullscreen_change(False)
-                return False
-                
-        except Exception as e:
-            print(f"Error checking fullscreen: {e}")
+        hwnd = user32.GetForegroundWindow()
+        if not hwnd:
+            self._last_foreground = None
+            return self._is_fullscreen
+        
+        if not user32.GetWindowRect(hwnd, ctypes.byref(_rect)):
+            logger.debug("GetWindowRect failed: error %d", ctypes.get_last_error())
+            self._last_foreground = None
+            return self._is_fullscreen
+        window_rect = (_rect.left, _rect.top, _rect.right, _rect.bottom)
+        if not force and hwnd == self._last_foreground and window_rect == self._last_rect:
+            return self._is_fullscreen
+        self._last_foreground = hwnd
+        self._last_rect = window_rect
+        
+        is_fullscreen = self._probe(hwnd, window_rect)
+        if is_fullscreen is None:
+            # Probe failed; retry on the next check
+            self._last_foreground = None
+            return self._is_fullscreen
+        
+        # Notify if state changed
+        if is_fullscreen != self._is_fullscreen:
+            self._is_fullscreen = is_fullscreen
+            if self.on_fullscreen_change:
+                self.on_fullscreen_change(is_fullscreen)
+        
+        return is_fullscreen
+    
+    def _cached_coverage(self, hwnd, window_rect: tuple) -> Optional[bool]:
+        """Get the remembered geometry result for hwnd if its rect and the screen haven't changed."""
+        entry = self._hwnd_cache.get(hwnd)
+        if entry is None or entry[0] != window_rect or entry[1] != get_screen_size():
+            return None
+        self._hwnd_cache.move_to_end(hwnd)
+        return entry[2]
+    
+    def _remember_coverage(self, hwnd, window_rect: tuple, covers: bool) -> None:
+        """Store a geometry result, evicting the least recently used window."""
+        self._hwnd_cache[hwnd] = (window_rect, get_screen_size(), covers)
+        self._hwnd_cache.move_to_end(hwnd)
+        if len(self._hwnd_cache) > _HWND_CACHE_SIZE:
+            self._hwnd_cache.popitem(last=False)
+    
+    def _probe(self, hwnd, window_rect: tuple) -> Optional[bool]:
+        """Run the full fullscreen test for hwnd; None if it could not be queried."""
+        # Our own overlay/notes windows are never a fullscreen app
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(_pid))
+        if _pid.value == self._own_pid:
             return False
+        
+        # Ask the shell first; fall back to the geometry heuristic whenever
+        # the shell doesn't report fullscreen (e.g. borderless games).
+        # The shell state is global, so only the per-window geometry
+        # result is cached.
+        is_fullscreen = self._query_notification_state()
+        if is_fullscreen is None:
+            is_fullscreen = self._cached_coverage(hwnd, window_rect)
+            if is_fullscreen is None:
+                is_fullscreen = self._covers_screen(hwnd, window_rect)
+                if is_fullscreen is not None:
+                    self._remember_coverage(hwnd, window_rect, is_fullscreen)
+        return is_fullscreen
+    
+    def _query_notification_state(self) -> Optional[bool]:
+        """
+        Use SHQueryUserNotificationState to detect fullscreen apps.
+        Returns True when the shell reports a fullscreen/busy state, or None
+        when the heuristic check should decide.
+        """
+        state = ctypes.c_int()
+        if shell32.SHQueryUserNotificationState(ctypes.byref(state)) != 0:
+            return None
+        if state.value in _FULLSCREEN_STATES:
+            return True
+        # Quiet time, Store apps, a normal desktop etc. say nothing about
+        # borderless windowed games, so let the geometry check decide
+        return None
+    
+    def _covers_screen(self, hwnd, window_rect: tuple) -> Optional[bool]:
+        """
+        Heuristic: a maximized window covering the screen or lacking a caption.
+        Returns None if the window could not be queried.
+        """
+        if not user32.GetWindowPlacement(hwnd, ctypes.byref(_placement)):
+            logger.debug("GetWindowPlacement failed: error %d", ctypes.get_last_error())
+            return None
+        if _placement.showCmd != SW_SHOWMAXIMIZED:
+            return False
+        
+        # Check if it covers the entire screen
+        screen_width, screen_height = get_screen_size()
+        
+        # Check if window covers entire screen (with small tolerance),
+        # using chained comparisons instead of four abs() calls
+        left, top, right, bottom = window_rect
+        covers_screen = (
+            -_COVER_TOLERANCE <= left <= _COVER_TOLERANCE and
+            -_COVER_TOLERANCE <= top <= _COVER_TOLERANCE and
+            -_COVER_TOLERANCE <= right - screen_width <= _COVER_TOLERANCE and
+            -_COVER_TOLERANCE <= bottom - screen_height <= _COVER_TOLERANCE
+        )
+        
+        # Also check if window has no title bar (common in fullscreen apps)
+        ctypes.set_last_error(0)
+        style = user32.GetWindowLongW(hwnd, GWL_STYLE)
+        if not style and ctypes.get_last_error():
+            logger.debug("GetWindowLongW failed: error %d", ctypes.get_last_error())
+            return None
+        has_title_bar = bool(style & WS_CAPTION)
+        
+        return covers_screen or not has_title_bar
     
     def is_fullscreen(self) -> bool:
         """Get current fullscreen state."""
         return self._is_fullscreen
-
@@ -0,0 +1,59 @@
+"""
+System-wide hotkey registration so the overlay can be toggled from any application.
+"""
+import ctypes
+import logging
+from ctypes import wintypes
+from typing import Callable
+from PyQt6.QtCore import QAbstractNativeEventFilter
+
+logger = logging.getLogger(__name__)
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+WM_HOTKEY = 0x0312
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_NOREPEAT = 0x4000
+VK_N = 0x4E
+
+user32.RegisterHotKey.restype = wintypes.BOOL
+user32.RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+user32.UnregisterHotKey.restype = wintypes.BOOL
+user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+
+
+class GlobalHotkey(QAbstractNativeEventFilter):
+    """Registers a Win32 hotkey on a window and reports WM_HOTKEY for it."""
+
+    def __init__(self, hwnd: int, hotkey_id: int, modifiers: int, vk: int,
+                 on_activated: Callable[[], None]):
+        super().__init__()
+        self.on_activated = on_activated
+        self._hwnd = hwnd
+        self._hotkey_id = hotkey_id
+        self._registered = bool(
+            user32.RegisterHotKey(hwnd, hotkey_id, modifiers | MOD_NOREPEAT, vk)
+        )
+        if not self._registered:
+            # Usually another application already owns the combination
+            logger.warning("RegisterHotKey failed: error %d", ctypes.get_last_error())
+
+    def is_registered(self) -> bool:
+        """Whether the system accepted the hotkey."""
+        return self._registered
+
+    def unregister(self) -> None:
+        """Release the hotkey."""
+        if self._registered:
+            user32.UnregisterHotKey(self._hwnd, self._hotkey_id)
+            self._registered = False
+
+    def nativeEventFilter(self, event_type, message):
+        """Consume WM_HOTKEY for our id; pass everything else through."""
+        if self._registered and event_type == b"windows_generic_MSG" and message:
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == self._hotkey_id:
+                self.on_activated()
+                return True, 0
+        return False, 0
@@ -1,16 +1,25 @@
 """
 Main application entry point for Notes Overlay.
 """
+import logging
 import sys
+from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QMainWindow, QSystemTrayIcon, QMenu
 from PyQt6.QtCore import (
     Qt,
     QTimer,
     QPropertyAnimation,
+    QVariantAnimation,
+    QAbstractAnimation,
     QEasingCurve,
+    QElapsedTimer,
     QParallelAnimationGroup,
+    QPoint,
     QRect,
+    QEvent,
     QSettings,
+    QRunnable,
+    QThreadPool,
 )
 from PyQt6.QtGui import QScreen, QKeySequence, QShortcut, QCursor, QIcon, QPixmap, QPainter, QColor
 
@@ -18,9 +27,37 @@ import config
 from overlay_button import OverlayButton
 from notes_window import NotesWindow
 from notes_manager import NotesManager
-from fullscreen_detector import FullscreenDetector
+from fullscreen_detector import FullscreenDetector, invalidate_screen_size
+from display_monitor import DisplayChangeFilter
+from global_hotkey import GlobalHotkey, MOD_ALT, MOD_CONTROL, VK_N
 from theme_manager import ThemeManager
 
+logger = logging.getLogger(__name__)
+
+# Geometry constants bound once at import; these are read on every drag
+# and animation step, so avoid a config attribute lookup each time.
+_BUTTON_WIDTH = config.BUTTON_WIDTH
+_BUTTON_HEIGHT = config.BUTTON_HEIGHT
+_BUTTON_HALF_WIDTH = _BUTTON_WIDTH // 2
+_NOTES_WINDOW_WIDTH = config.NOTES_WINDOW_WIDTH
+_NOTES_WINDOW_HEIGHT = config.NOTES_WINDOW_HEIGHT
+_ANIMATION_DURATION = config.ANIMATION_DURATION
+
+# Tray icon file in the same folder as main.py
+_ICON_PATH = Path(__file__).resolve().parent / "app.ico"
+
+
+class _SaveNotesJob(QRunnable):
+    """Writes a notes snapshot to disk on a worker thread."""
+    
+    def __init__(self, notes_manager: NotesManager, content: str):
+        super().__init__()
+        self._notes_manager = notes_manager
+        self._content = content
+    
+    def run(self):
+        self._notes_manager.save_notes(self._content)
+
 
 class OverlayMainWindow(QMainWindow):
     """Main overlay window that manages button and notes window."""
@@ -32,22 +69,37 @@ class OverlayMainWindow(QMainWindow):
         self._button_y = config.BUTTON_TOP_MARGIN
         self._button_side = "right"  # "left" or "right"
         self._current_screen = None  # Track which screen the button is on
+        # Cached geometry of the current screen (invalidated on screen changes)
+        self._screen_bounds_cache = None  # Plain (x, y, w, h) ints
+        self._max_drag_y_cache = None  # Lowest button Y inside the work area
+        self._button_x_cache = None  # Docked button X per side
+        # Memoized notes window target geometry and the inputs it was built from
+        self._notes_geom_cache_key = None
+        self._notes_geom_cache = None
+        self._notes_expand_start_rect = None
+        self._notes_collapse_end_rect = None
         self._drag_start_global_y = None
         self._drag_start_button_y = None
+        self._pending_drag_y = None  # Latest drag Y not yet applied
         # Settings for persisting button side preference
         self._settings = QSettings("NotesOverlay", config.APP_NAME)
         self._notes_manager = NotesManager()
+        # Single worker so background saves land on disk in order
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
         self._fullscreen_detector = FullscreenDetector(self._on_fullscreen_change)
         
         self._setup_window()
         self._setup_widgets()
         self._setup_animations()
         self._setup_timers()
-        self._setup_system_tray()
+        # Tray icon (icon file I/O + balloon) is set up on the first event
+        # loop turn so the overlay appears first
+        self.tray_icon = None
+        QTimer.singleShot(0, self._setup_system_tray)
         self._load_button_side()
         self._detect_current_screen()  # Detect which screen button is on
         self._position_widgets()
-        self._load_notes()
         # Setup shortcuts AFTER everything else is initialized
         self._setup_shortcuts()
         # Monitor screen changes
@@ -69,7 +121,7 @@ class OverlayMainWindow(QMainWindow):
         # We'll handle this dynamically
         
         # Set initial size to cover button area
-        self.setFixedSize(config.BUTTON_WIDTH, config.BUTTON_HEIGHT)
+        self.setFixedSize(_BUTTON_WIDTH, _BUTTON_HEIGHT)
     
     def _setup_widgets(self):
         """Create and setup UI widgets."""
@@ -80,6 +132,15 @@ class OverlayMainWindow(QMainWindow):
         self.button.dragMoved.connect(self._on_button_drag_moved)
         self.button.dragEnded.connect(self._on_button_drag_ended)
         
+        # The notes window is created on first expand (_ensure_notes_ready)
+        # so startup only pays for the button
+        self.notes_window = None
+    
+    def _ensure_notes_ready(self):
+        """Create the notes window and load saved notes on first use."""
+        if self.notes_window is not None:
+            return
+        
         # Create notes window as separate top-level window (initially hidden)
         self.notes_window = NotesWindow()
         self.notes_window.setWindowFlags(
@@ -87,25 +148,30 @@ class OverlayMainWindow(QMainWindow):
             Qt.WindowType.WindowStaysOnTopHint |
             Qt.WindowType.Tool
         )
+        self._load_notes()
         self.notes_window.content_changed.connect(self._on_notes_changed)
+        # Follow system light/dark switches
+        QApplication.styleHints().colorSchemeChanged.connect(self.notes_window.schedule_theme_refresh)
         self.notes_window.hide()
+        
+        # Also register the visibility shortcut on notes window as backup
+        self._visibility_shortcut_notes = QShortcut(QKeySequence("Ctrl+Alt+N"), self.notes_window)
+        self._visibility_shortcut_notes.setContext(Qt.ShortcutContext.ApplicationShortcut)
+        self._visibility_shortcut_notes.activated.connect(self._toggle_manual_visibility)
     
     def _setup_system_tray(self):
         """Setup system tray icon with context menu."""
-        # Load icon from app.ico file in the same folder as main.py
-        import os
-        
-        # Get the directory where main.py is located
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_path = os.path.join(current_dir, "app.ico")
-        
         # Try to load the icon file, fall back to generated icon if file not found
-        if os.path.exists(icon_path):
-            icon = QIcon(icon_path)
-            print(f"Loaded icon from: {icon_path}")
+        if _ICON_PATH.is_file():
+            icon = QIcon(str(_ICON_PATH))
+            logger.debug("Loaded icon from: %s", _ICON_PATH)
         else:
-            print(f"Warning: app.ico not found at {icon_path}, using generated icon")
-            icon = self._create_tray_icon()
+            logger.warning("app.ico not found at %s, using generated icon", _ICON_PATH)
+            # Reuse the icon rendered on a previous run when there is one
+            if config.TRAY_ICON_CACHE.exists():
+                icon = QIcon(str(config.TRAY_ICON_CACHE))
+            else:
+                icon = self._create_tray_icon()
         
         # Create system tray icon
         self.tray_icon = QSystemTrayIcon(icon, self)
@@ -165,6 +231,9 @@ class OverlayMainWindow(QMainWindow):
         
         painter.end()
         
+        # Cache the rendering so later launches just decode it
+        pixmap.save(str(config.TRAY_ICON_CACHE), "PNG")
+        
         return QIcon(pixmap)
     
     def _on_tray_activated(self, reason):
@@ -176,50 +245,142 @@ class OverlayMainWindow(QMainWindow):
     def _exit_application(self):
         """Exit the application completely."""
         # Save notes before exiting
-        content = self.notes_window.get_content()
-        self._notes_manager.save_notes(content)
+        self._save_notes_now()
+        # Flush buffered settings (button side/Y) in one write
+        self._settings.sync()
         
         # Hide tray icon
-        self.tray_icon.hide()
+        if self.tray_icon is not None:
+            self.tray_icon.hide()
+        
+        # Release the WinEvent hook and global hotkey
+        self._fullscreen_detector.stop()
+        self._global_hotkey.unregister()
         
         # Quit the application
         QApplication.quit()
     
     def _setup_animations(self):
         """Setup expansion/collapse animations."""
+        # Constant button positions within the overlay window. Sizes never
+        # change while animating, so only positions are animated (a move per
+        # frame instead of a move + resize).
+        self._button_collapsed_pos = QPoint(0, 0)
+        # Expanded: right side shifts RIGHT (positive X), left side shifts LEFT
+        self._button_expanded_positions = {
+            "right": QPoint(5, 0),
+            "left": QPoint(-5, 0),
+        }
+        
+        # One easing curve shared by every animation
+        self._easing_curve = QEasingCurve(QEasingCurve.Type.OutCubic)
+        
         # Button position animation
-        self._button_animation = QPropertyAnimation(self.button, b"geometry")
-        self._button_animation.setDuration(config.ANIMATION_DURATION)
-        self._button_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._button_animation = QPropertyAnimation(self.button, b"pos")
+        self._button_animation.setDuration(_ANIMATION_DURATION)
+        self._button_animation.setEasingCurve(self._easing_curve)
 
         # Snap animation for the overlay window (button container)
         self._snap_animation = QPropertyAnimation(self, b"pos")
-        self._snap_animation.setDuration(config.ANIMATION_DURATION)
-        self._snap_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._snap_animation.setDuration(_ANIMATION_DURATION)
+        self._snap_animation.setEasingCurve(self._easing_curve)
         self._snap_animation.finished.connect(self._position_notes_window)
         
-        # Notes window opacity animation
-        self._notes_opacity_animation = QPropertyAnimation(self.notes_window, b"windowOpacity")
-        self._notes_opacity_animation.setDuration(config.ANIMATION_DURATION)
-        self._notes_opacity_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        # Notes window geometry animation
-        self._notes_geometry_animation = QPropertyAnimation(self.notes_window, b"geometry")
-        self._notes_geometry_animation.setDuration(config.ANIMATION_DURATION)
-        self._notes_geometry_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        # Notes window animation: a single 0..1 progress value drives both
+        # position and opacity so each frame updates the window once
+        self._notes_from_pos = QPoint()
+        self._notes_to_pos = QPoint()
+        self._notes_from_opacity = 0.0
+        self._notes_to_opacity = 1.0
+        self._notes_animation = QVariantAnimation(self)
+        self._notes_animation.setDuration(_ANIMATION_DURATION)
+        self._notes_animation.setEasingCurve(self._easing_curve)
+        self._notes_animation.setStartValue(0.0)
+        self._notes_animation.setEndValue(1.0)
+        self._notes_animation.valueChanged.connect(self._on_notes_animation_step)
+        self._notes_animation.finished.connect(self._maybe_hide_notes)
         
         # Parallel animation group
         self._animation_group = QParallelAnimationGroup()
         self._animation_group.addAnimation(self._button_animation)
-        self._animation_group.addAnimation(self._notes_opacity_animation)
-        self._animation_group.addAnimation(self._notes_geometry_animation)
+        self._animation_group.addAnimation(self._notes_animation)
+        
+        # Frame pacing of completed runs (EMA of ms per frame); on slow
+        # systems animations are shortened so per-frame cost is paid less
+        self._frame_clock = QElapsedTimer()
+        self._frame_count = 0
+        self._frame_time_ema = None
+        self._animation_group.finished.connect(self._on_animation_finished)
+    
+    def _start_animation_group(self):
+        """Start the expand/collapse animations and begin timing their frames."""
+        self._frame_count = 0
+        self._frame_clock.start()
+        self._animation_group.start()
+    
+    def _on_animation_finished(self):
+        """Fold the finished run's frame time into the EMA and adapt durations."""
+        if self._frame_count < 2:
+            # Fast-forwarded on fullscreen (count reset) or too short to measure
+            return
+        frame_time = self._frame_clock.elapsed() / self._frame_count
+        if self._frame_time_ema is None:
+            self._frame_time_ema = frame_time
+        else:
+            self._frame_time_ema = 0.7 * self._frame_time_ema + 0.3 * frame_time
+        
+        if self._frame_time_ema > config.SLOW_FRAME_THRESHOLD:
+            duration = config.ANIMATION_DURATION_SLOW
+        else:
+            duration = _ANIMATION_DURATION
+        if duration != self._notes_animation.duration():
+            for animation in (self._button_animation, self._snap_animation, self._notes_animation):
+                animation.setDuration(duration)
+    
+    def _on_notes_animation_step(self, progress: float):
+        """Apply interpolated position and opacity to the notes window."""
+        self._frame_count += 1
+        start = self._notes_from_pos
+        end = self._notes_to_pos
+        self.notes_window.move(
+            start.x() + round((end.x() - start.x()) * progress),
+            start.y() + round((end.y() - start.y()) * progress),
+        )
+        self.notes_window.setWindowOpacity(
+            self._notes_from_opacity + (self._notes_to_opacity - self._notes_from_opacity) * progress
+        )
     
     def _setup_timers(self):
         """Setup periodic timers."""
-        # Fullscreen detection timer
+        # Fullscreen detection timer. When the WinEvent hook is active this is
+        # only a slow safety net; otherwise it is the primary detection path.
+        # Coarse timers tolerate a few % jitter, so Windows can coalesce
+        # wakeups instead of raising the system timer resolution.
         self._fullscreen_timer = QTimer(self)
+        self._fullscreen_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._fullscreen_timer.timeout.connect(self._check_fullscreen)
-        self._fullscreen_timer.start(config.FULLSCREEN_CHECK_INTERVAL)
+        self._fullscreen_timer.start(self._fullscreen_poll_interval())
+        
+        # Drag coalescing timer: apply at most one reposition per frame
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(config.DRAG_UPDATE_INTERVAL)
+        self._drag_timer.timeout.connect(self._apply_pending_drag)
+        
+        # Notes save debounce timer: write once typing pauses
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(config.SAVE_DEBOUNCE_INTERVAL)
+        self._save_timer.timeout.connect(self._flush_notes)
+        # Time since the oldest unsaved change; invalid while nothing is pending
+        self._save_pending_clock = QElapsedTimer()
+    
+    def _fullscreen_poll_interval(self) -> int:
+        """Normal fullscreen poll interval for the active detection mode."""
+        if self._fullscreen_detector.is_event_driven():
+            return config.FULLSCREEN_FALLBACK_INTERVAL
+        return config.FULLSCREEN_CHECK_INTERVAL
     
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts."""
@@ -228,20 +389,37 @@ class OverlayMainWindow(QMainWindow):
         self._visibility_shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
         self._visibility_shortcut.activated.connect(self._toggle_manual_visibility)
         
-        # Also register on notes window as backup
-        self._visibility_shortcut_notes = QShortcut(QKeySequence("Ctrl+Alt+N"), self.notes_window)
-        self._visibility_shortcut_notes.setContext(Qt.ShortcutContext.ApplicationShortcut)
-        self._visibility_shortcut_notes.activated.connect(self._toggle_manual_visibility)
+        # Register Ctrl+Alt+N system-wide too, so it works while another
+        # application has focus. While registered, Windows delivers the key
+        # as WM_HOTKEY only, so the Qt shortcuts above stay as a fallback.
+        self._global_hotkey = GlobalHotkey(
+            int(self.winId()), 1, MOD_CONTROL | MOD_ALT, VK_N,
+            self._toggle_manual_visibility,
+        )
+        QApplication.instance().installNativeEventFilter(self._global_hotkey)
     
     def _setup_screen_monitoring(self):
         """Setup monitoring for screen configuration changes."""
         # Connect to screen added/removed signals
         app = QApplication.instance()
-        app.screenAdded.connect(self._on_screen_configuration_changed)
+        app.screenAdded.connect(self._on_screen_added)
         app.screenRemoved.connect(self._on_screen_configuration_changed)
         
         # Monitor primary screen changes
         app.primaryScreenChanged.connect(self._on_screen_configuration_changed)
+        
+        # Keep cached screen geometry in sync with resolution/work-area changes
+        for screen in QApplication.screens():
+            self._watch_screen(screen)
+        
+        # Also catch WM_DISPLAYCHANGE / WM_DPICHANGED / WM_SETTINGCHANGE directly
+        self._display_filter = DisplayChangeFilter(self._on_display_settings_changed)
+        app.installNativeEventFilter(self._display_filter)
+    
+    def _on_display_settings_changed(self):
+        """Drop every cached screen metric after a system display change."""
+        invalidate_screen_size()
+        self._invalidate_screen_cache()
     
     def _detect_current_screen(self):
         """Detect which screen the button is currently on."""
@@ -249,11 +427,17 @@ class OverlayMainWindow(QMainWindow):
         
         for screen in QApplication.screens():
             if screen.geometry().contains(button_center):
-                self._current_screen = screen
+                self._set_current_screen(screen)
                 return
         
         # Fallback to primary screen if not found
-        self._current_screen = QApplication.primaryScreen()
+        self._set_current_screen(QApplication.primaryScreen())
+    
+    def _set_current_screen(self, screen):
+        """Switch the tracked screen, dropping cached geometry if it changed."""
+        if screen is not self._current_screen:
+            self._current_screen = screen
+            self._invalidate_screen_cache()
     
     def _get_current_screen(self):
         """Get the screen that the button is currently on."""
@@ -261,9 +445,51 @@ class OverlayMainWindow(QMainWindow):
             self._detect_current_screen()
         return self._current_screen
     
+    def _get_screen_bounds(self):
+        """Get the (cached) current screen geometry as an (x, y, width, height) tuple."""
+        if self._screen_bounds_cache is None:
+            geometry = self._get_current_screen().geometry()
+            self._screen_bounds_cache = (geometry.x(), geometry.y(), geometry.width(), geometry.height())
+        return self._screen_bounds_cache
+    
+    def _get_max_drag_y(self):
+        """Get the (cached) largest button Y that keeps it inside the work area."""
+        if self._max_drag_y_cache is None:
+            self._max_drag_y_cache = self._get_current_screen().availableGeometry().height() - _BUTTON_HEIGHT
+        return self._max_drag_y_cache
+    
+    def _get_button_x(self):
+        """Get the docked X of the button for the current side (cached)."""
+        if self._button_x_cache is None:
+            screen_x, _, screen_width, _ = self._get_screen_bounds()
+            self._button_x_cache = {
+                "left": screen_x,
+                "right": screen_x + screen_width - _BUTTON_WIDTH,
+            }
+        return self._button_x_cache[self._button_side]
+    
+    def _invalidate_screen_cache(self, *args):
+        """Drop cached screen geometry so it is re-queried on next use."""
+        self._screen_bounds_cache = None
+        self._button_x_cache = None
+        self._max_drag_y_cache = None
+        self._notes_geom_cache_key = None
+        self._notes_geom_cache = None
+    
+    def _watch_screen(self, screen):
+        """Invalidate cached geometry when a screen's geometry changes."""
+        screen.geometryChanged.connect(self._invalidate_screen_cache)
+        screen.availableGeometryChanged.connect(self._invalidate_screen_cache)
+    
+    def _on_screen_added(self, screen):
+        """Handle a newly attached screen."""
+        self._watch_screen(screen)
+        self._on_screen_configuration_changed(screen)
+    
     def _on_screen_configuration_changed(self, screen=None):
         """Handle screen configuration changes (added/removed/changed)."""
-        # Re-detect current screen
+        # Drop cached geometry and re-detect current screen
+        self._invalidate_screen_cache()
         self._detect_current_screen()
         
         # Reposition widgets to ensure they're still on a valid screen
@@ -275,28 +501,33 @@ class OverlayMainWindow(QMainWindow):
     
     def _position_widgets(self):
         """Position widgets on screen."""
-        screen = self._get_current_screen()
-        screen_geometry = screen.geometry()
+        screen_height = self._get_screen_bounds()[3]
         
         # Clamp button position to current screen bounds
-        max_y = screen_geometry.height() - config.BUTTON_HEIGHT
+        max_y = screen_height - _BUTTON_HEIGHT
         self._button_y = max(0, min(max_y, self._button_y))
         
         self._apply_button_position()
         self._position_notes_window()
 
     def _load_button_side(self):
-        """Load persisted button side (left/right)."""
+        """Load persisted button side (left/right) and vertical position."""
         side = self._settings.value("button_side", "right")
         if side in ("left", "right"):
             self._button_side = side
         else:
             self._button_side = "right"
+        # Clamped to the current screen by _position_widgets
+        self._button_y = self._settings.value("button_y", config.BUTTON_TOP_MARGIN, type=int)
 
     def _save_button_side(self):
         """Persist current button side."""
         self._settings.setValue("button_side", self._button_side)
     
+    def _save_button_y(self):
+        """Persist current button vertical position."""
+        self._settings.setValue("button_y", self._button_y)
+    
     def _toggle_expansion(self):
         """Toggle between collapsed and expanded states."""
         if self._is_hidden:
@@ -311,42 +542,37 @@ class OverlayMainWindow(QMainWindow):
         if self._is_expanded:
             return
         
+        self._ensure_notes_ready()
         self._is_expanded = True
+        # May be reversing a collapse that froze painting
+        self.notes_window.setUpdatesEnabled(True)
         
-        screen = self._get_current_screen()
-        screen_geometry = screen.geometry()
-        screen_width = screen_geometry.width()
-
-        # Calculate button X based on side (do NOT move the button vertically)
-        if self._button_side == "right":
-            button_x = screen_geometry.x() + screen_width - config.BUTTON_WIDTH
-        else:
-            button_x = screen_geometry.x()
-
-        # Target geometry for notes window that keeps it on-screen
+        # Target geometry for notes window that keeps it on-screen; this also
+        # refreshes the cached animation endpoints if anything moved
         notes_target_geom = self._compute_notes_target_geometry()
         
-        # Show notes window
-        self.notes_window.setWindowOpacity(0.0)
-        self.notes_window.show()
+        if self._animation_group.state() == QAbstractAnimation.State.Running:
+            # Reversing a collapse mid-flight: continue from the live state
+            # (start() is a no-op on a running group)
+            self._animation_group.stop()
+            button_start = self.button.pos()
+            notes_start = self.notes_window.pos()
+            notes_opacity = self.notes_window.windowOpacity()
+        else:
+            button_start = self._button_collapsed_pos
+            notes_start = self._notes_expand_start_rect.topLeft()
+            notes_opacity = 0.0
+            # Show notes window; size is set once here, frames only move it
+            self.notes_window.setWindowOpacity(0.0)
+            self.notes_window.setGeometry(self._notes_expand_start_rect)
+            self.notes_window.show()
         
         # Animate button - direction depends on which side it's on
-        button_start = QRect(0, 0, config.BUTTON_WIDTH, config.BUTTON_HEIGHT)
-        if self._button_side == "right":
-            # Right side: shift RIGHT (positive X)
-            button_end = QRect(5, 0, config.BUTTON_WIDTH, config.BUTTON_HEIGHT)
-        else:
-            # Left side: shift LEFT (negative X)
-            button_end = QRect(-5, 0, config.BUTTON_WIDTH, config.BUTTON_HEIGHT)
+        button_end = self._button_expanded_positions[self._button_side]
         
         # Animate notes window (fade in and slide from appropriate side)
         # Notes window is positioned on screen coordinates
-        notes_start = QRect(
-            button_x, notes_target_geom.y(),
-            config.NOTES_WINDOW_WIDTH,
-            config.NOTES_WINDOW_HEIGHT
-        )
-        notes_end = notes_target_geom
+        notes_end = notes_target_geom.topLeft()
         
         # Main window stays the same size (only button window)
         # Don't animate main window for now - it stays button-sized
@@ -355,15 +581,14 @@ class OverlayMainWindow(QMainWindow):
         self._button_animation.setStartValue(button_start)
         self._button_animation.setEndValue(button_end)
         
-        self._notes_opacity_animation.setStartValue(0.0)
-        self._notes_opacity_animation.setEndValue(1.0)
-        
-        self._notes_geometry_animation.setStartValue(notes_start)
-        self._notes_geometry_animation.setEndValue(notes_end)
+        self._notes_from_opacity = notes_opacity
+        self._notes_to_opacity = 1.0
+        self._notes_from_pos = notes_start
+        self._notes_to_pos = notes_end
         
         # Remove window animation from group since we're not using it
         # Start animations
-        self._animation_group.start()
+        self._start_animation_group()
     
     def _collapse(self):
         """Collapse the notes window."""
@@ -372,62 +597,45 @@ class OverlayMainWindow(QMainWindow):
         
         self._is_expanded = False
         
-        screen = self._get_current_screen()
-        screen_geometry = screen.geometry()
-        screen_width = screen_geometry.width()
-
-        # Calculate positions based on which side the button is on
-        if self._button_side == "right":
-            button_x = screen_geometry.x() + screen_width - config.BUTTON_WIDTH
-            notes_end_x = button_x
-        else:
-            button_x = screen_geometry.x()
-            notes_end_x = button_x - config.NOTES_WINDOW_WIDTH
-
-        button_y = self._button_y
+        # Refresh cached endpoints for the current side/position if needed
+        self._compute_notes_target_geometry()
+        
+        # Reversing an expand mid-flight; the live values below pick up
+        # from wherever it got to
+        self._animation_group.stop()
         
         # Animate button back
-        button_start = self.button.geometry()
-        button_end = QRect(0, 0, config.BUTTON_WIDTH, config.BUTTON_HEIGHT)
-        
-        notes_start = self.notes_window.geometry()
-        notes_end = QRect(
-            notes_end_x, button_y,
-            config.NOTES_WINDOW_WIDTH,
-            config.NOTES_WINDOW_HEIGHT
-        )
+        button_start = self.button.pos()
+        button_end = self._button_collapsed_pos
+        
+        notes_start = self.notes_window.pos()
+        notes_end = self._notes_collapse_end_rect.topLeft()
         
         # Setup animations
         self._button_animation.setStartValue(button_start)
         self._button_animation.setEndValue(button_end)
         
-        self._notes_opacity_animation.setStartValue(1.0)
-        self._notes_opacity_animation.setEndValue(0.0)
+        self._notes_from_opacity = self.notes_window.windowOpacity()
+        self._notes_to_opacity = 0.0
+        self._notes_from_pos = notes_start
+        self._notes_to_pos = notes_end
         
-        self._notes_geometry_animation.setStartValue(notes_start)
-        self._notes_geometry_animation.setEndValue(notes_end)
+        # Contents don't change while sliding out, so skip repainting them
+        # until the window is hidden (re-enabled in _maybe_hide_notes)
+        self.notes_window.setUpdatesEnabled(False)
         
-        # Start animations
-        self._animation_group.start()
-        
-        # Hide notes window after animation completes
-        def hide_notes():
-            if not self._is_expanded:
-                self.notes_window.hide()
-        
-        self._notes_opacity_animation.finished.connect(hide_notes)
+        # Start animations (notes window is hidden by _maybe_hide_notes)
+        self._start_animation_group()
+    
+    def _maybe_hide_notes(self):
+        """Hide the notes window once a collapse animation has finished."""
+        if not self._is_expanded:
+            self.notes_window.hide()
+            self.notes_window.setUpdatesEnabled(True)
     
     def _apply_button_position(self):
         """Move the overlay button window to the current Y coordinate."""
-        screen = self._get_current_screen()
-        screen_geometry = screen.geometry()
-        
-        if self._button_side == "right":
-            button_x = screen_geometry.x() + screen_geometry.width() - config.BUTTON_WIDTH
-        else:
-            button_x = screen_geometry.x()
-        
-        self.move(button_x, screen_geometry.y() + self._button_y)
+        self.move(self._get_button_x(), self._get_screen_bounds()[1] + self._button_y)
         self.button.move(0, 0)
 
     def _compute_notes_target_geometry(self):
@@ -437,61 +645,80 @@ class OverlayMainWindow(QMainWindow):
         Default: open below the button; if there isn't enough space below,
         open above instead.
         """
-        screen = self._get_current_screen()
-        screen_geometry = screen.geometry()
-        screen_width = screen_geometry.width()
-        screen_height = screen_geometry.height()
+        screen_bounds = self._get_screen_bounds()
+        cache_key = (self._button_side, self._button_y, screen_bounds)
+        if cache_key == self._notes_geom_cache_key:
+            return self._notes_geom_cache
+
+        screen_x, screen_y, screen_width, screen_height = screen_bounds
 
         # Button position and size (relative to current screen)
-        if self._button_side == "right":
-            button_x = screen_geometry.x() + screen_width - config.BUTTON_WIDTH
-        else:
-            button_x = screen_geometry.x()
-        button_y = screen_geometry.y() + self._button_y
+        button_x = self._get_button_x()
+        button_y = screen_y + self._button_y
         button_top = button_y
-        button_bottom = button_y + config.BUTTON_HEIGHT
+        button_bottom = button_y + _BUTTON_HEIGHT
 
         # Available vertical space (relative to current screen)
         space_above = self._button_y
-        space_below = screen_height - (self._button_y + config.BUTTON_HEIGHT)
+        space_below = screen_height - (self._button_y + _BUTTON_HEIGHT)
 
         # Decide whether to show notes above or below the button
-        if space_below < config.NOTES_WINDOW_HEIGHT:
+        if space_below < _NOTES_WINDOW_HEIGHT:
             # Not enough space below; show entirely above the button
-            notes_y = max(screen_geometry.y(), button_top - (config.NOTES_WINDOW_HEIGHT - config.BUTTON_HEIGHT))
+            notes_y = max(screen_y, button_top - (_NOTES_WINDOW_HEIGHT - _BUTTON_HEIGHT))
         else:
             # Default: place top of notes at the bottom of the button, clamped to screen
-            notes_y = min(button_bottom - config.BUTTON_HEIGHT, 
-                         screen_geometry.y() + screen_height - config.NOTES_WINDOW_HEIGHT)
+            notes_y = min(button_bottom - _BUTTON_HEIGHT, 
+                         screen_y + screen_height - _NOTES_WINDOW_HEIGHT)
 
         # Horizontal positioning based on button side
         if self._button_side == "right":
-            preferred_x = button_x - config.NOTES_WINDOW_WIDTH
+            preferred_x = button_x - _NOTES_WINDOW_WIDTH
         else:
-            preferred_x = button_x + config.BUTTON_WIDTH
+            preferred_x = button_x + _BUTTON_WIDTH
 
         # Clamp horizontally so window stays fully on current screen
-        notes_x = max(screen_geometry.x(), 
-                     min(screen_geometry.x() + screen_width - config.NOTES_WINDOW_WIDTH, preferred_x))
+        notes_x = max(screen_x, 
+                     min(screen_x + screen_width - _NOTES_WINDOW_WIDTH, preferred_x))
 
-        return QRect(
+        self._notes_geom_cache_key = cache_key
+        self._notes_geom_cache = QRect(
             notes_x,
             notes_y,
-            config.NOTES_WINDOW_WIDTH,
-            config.NOTES_WINDOW_HEIGHT,
+            _NOTES_WINDOW_WIDTH,
+            _NOTES_WINDOW_HEIGHT,
+        )
+        
+        # Animation endpoints derived from the same inputs: expand slides in
+        # from the button edge, collapse slides back toward it
+        self._notes_expand_start_rect = QRect(
+            button_x, notes_y,
+            _NOTES_WINDOW_WIDTH,
+            _NOTES_WINDOW_HEIGHT
         )
+        if self._button_side == "right":
+            notes_end_x = button_x
+        else:
+            notes_end_x = button_x - _NOTES_WINDOW_WIDTH
+        self._notes_collapse_end_rect = QRect(
+            notes_end_x, self._button_y,
+            _NOTES_WINDOW_WIDTH,
+            _NOTES_WINDOW_HEIGHT
+        )
+        return self._notes_geom_cache
 
     def _position_notes_window(self):
         """Align notes window with the button, keeping it fully on-screen."""
+        # Nothing to align while collapsed; _expand computes its own target
+        if self.notes_window is None or (not self._is_expanded and not self.notes_window.isVisible()):
+            return
         target_geom = self._compute_notes_target_geometry()
-        self.notes_window.setGeometry(target_geom)
+        if self.notes_window.geometry() != target_geom:
+            self.notes_window.setGeometry(target_geom)
     
     def _clamp_button_position(self, desired_y: int) -> int:
         """Keep button within the vertical bounds of the current screen."""
-        screen = self._get_current_screen()
-        screen_geometry = screen.availableGeometry()
-        max_y = screen_geometry.height() - config.BUTTON_HEIGHT
-        return max(0, min(max_y, desired_y))
+        return max(0, min(self._get_max_drag_y(), desired_y))
     
     def _on_button_drag_started(self, global_y: float):
         """Store initial positions at the start of a drag."""
@@ -499,22 +726,36 @@ class OverlayMainWindow(QMainWindow):
         self._drag_start_button_y = self._button_y
     
     def _on_button_drag_moved(self, global_y: float):
-        """Update button and notes positions while dragging."""
+        """Record the latest drag position; it is applied once per frame."""
         if self._drag_start_global_y is None or self._drag_start_button_y is None:
             return
         
+        self._pending_drag_y = global_y
+        if not self._drag_timer.isActive():
+            self._drag_timer.start()
+    
+    def _apply_pending_drag(self):
+        """Update button and notes positions from the latest drag sample."""
+        global_y = self._pending_drag_y
+        self._pending_drag_y = None
+        if global_y is None or self._drag_start_global_y is None or self._drag_start_button_y is None:
+            return
+        
         # Get cursor position to detect which screen we're on
         cursor_pos = QCursor.pos()
-        
-        # Detect which screen the cursor is currently on
-        for screen in QApplication.screens():
-            if screen.geometry().contains(cursor_pos):
-                self._current_screen = screen
-                break
-        
-        screen_geometry = self._get_current_screen().geometry()
-        screen_width = screen_geometry.width()
-        screen_height = screen_geometry.height()
+        cursor_x = cursor_pos.x()
+        cursor_y = cursor_pos.y()
+        
+        # Detect which screen the cursor is currently on; the cached bounds
+        # are plain ints, so screens are only rescanned when it leaves them
+        screen_x, screen_y, screen_width, screen_height = self._get_screen_bounds()
+        if not (screen_x <= cursor_x < screen_x + screen_width and
+                screen_y <= cursor_y < screen_y + screen_height):
+            for screen in QApplication.screens():
+                if screen.geometry().contains(cursor_pos):
+                    self._set_current_screen(screen)
+                    break
+            screen_x, screen_y, screen_width, screen_height = self._get_screen_bounds()
         
         # Vertical movement (adjusted for screen position)
         delta = int(global_y - self._drag_start_global_y)
@@ -523,42 +764,50 @@ class OverlayMainWindow(QMainWindow):
 
         # Horizontal movement follows the cursor during drag
         # Center button on cursor X while keeping it on current screen
-        tentative_x = int(cursor_pos.x() - config.BUTTON_WIDTH / 2)
-        tentative_x = max(screen_geometry.x(), 
-                         min(screen_geometry.x() + screen_width - config.BUTTON_WIDTH, tentative_x))
-        
-        self.move(tentative_x, screen_geometry.y() + self._button_y)
-        self.button.move(0, 0)
-        self._position_notes_window()
+        tentative_x = cursor_x - _BUTTON_HALF_WIDTH
+        tentative_x = max(screen_x, min(screen_x + screen_width - _BUTTON_WIDTH, tentative_x))
+        
+        # The button's offset inside the overlay is unaffected by moving the
+        # overlay itself, so only the top-level window moves per frame
+        self.move(tentative_x, screen_y + self._button_y)
+        # A hidden notes window is placed by _expand from _button_y, so
+        # only a visible one needs to follow the drag
+        if self.notes_window is not None and self.notes_window.isVisible():
+            self._position_notes_window()
     
     def _on_button_drag_ended(self):
         """Reset drag tracking when the drag finishes."""
+        # Apply any drag sample still waiting for the next frame
+        self._drag_timer.stop()
+        self._apply_pending_drag()
+        
+        if self._drag_start_button_y is not None and self._button_y != self._drag_start_button_y:
+            self._save_button_y()
         self._drag_start_global_y = None
         self._drag_start_button_y = None
 
         # Decide which side to snap to based on final horizontal position on current screen
-        screen = self._get_current_screen()
-        screen_geometry = screen.geometry()
-        screen_center_x = screen_geometry.x() + (screen_geometry.width() / 2)
-        button_center_x = self.x() + (config.BUTTON_WIDTH / 2)
+        screen_x, _, screen_width, _ = self._get_screen_bounds()
+        screen_center_x = screen_x + (screen_width / 2)
+        button_center_x = self.x() + (_BUTTON_WIDTH / 2)
 
+        previous_side = self._button_side
         if button_center_x < screen_center_x:
             self._button_side = "left"
         else:
             self._button_side = "right"
 
-        self._save_button_side()
+        # Only touch persistent settings when the side actually changed
+        if self._button_side != previous_side:
+            self._save_button_side()
+            # The expanded nudge points toward the docked edge
+            if self._is_expanded:
+                self.button.move(self._button_expanded_positions[self._button_side])
         self._snap_button_to_current_side()
 
     def _snap_button_to_current_side(self):
         """Animate button snapping to the nearest screen edge while keeping Y."""
-        screen = self._get_current_screen()
-        screen_geometry = screen.geometry()
-        
-        if self._button_side == "right":
-            target_x = screen_geometry.x() + screen_geometry.width() - config.BUTTON_WIDTH
-        else:
-            target_x = screen_geometry.x()
+        target_x = self._get_button_x()
 
         start_pos = self.pos()
         end_pos = start_pos
@@ -569,9 +818,32 @@ class OverlayMainWindow(QMainWindow):
         self._snap_animation.setEndValue(end_pos)
         self._snap_animation.start()
     
-    def _on_notes_changed(self, content: str):
-        """Handle notes content change."""
-        self._notes_manager.save_notes(content)
+    def _on_notes_changed(self):
+        """Handle notes content change (saved after a short pause)."""
+        if not self._save_pending_clock.isValid():
+            self._save_pending_clock.start()
+        elif self._save_pending_clock.hasExpired(config.SAVE_MAX_DELAY):
+            # Typing without a pause would otherwise postpone the save forever
+            self._save_timer.stop()
+            self._flush_notes()
+            return
+        self._save_timer.start()
+    
+    def _flush_notes(self):
+        """Snapshot all tabs once and hand them to the background save worker."""
+        self._save_pending_clock.invalidate()
+        content = self.notes_window.get_all_content()
+        self._save_pool.start(_SaveNotesJob(self._notes_manager, content))
+    
+    def _save_notes_now(self):
+        """Synchronously persist all tabs (used when shutting down)."""
+        self._save_timer.stop()
+        self._save_pending_clock.invalidate()
+        self._save_pool.waitForDone()
+        # Notes were never opened, so the file on disk is already current
+        if self.notes_window is None:
+            return
+        self._notes_manager.save_notes(self.notes_window.get_all_content())
     
     def _load_notes(self):
         """Load saved notes."""
@@ -589,7 +861,20 @@ class OverlayMainWindow(QMainWindow):
             # Hide overlay when fullscreen app is active
             if self.isVisible():
                 self.hide()
+            # Stay as idle as possible while the fullscreen app runs:
+            # finish any running animation now and poll less often
+            if self._animation_group.state() == QAbstractAnimation.State.Running:
+                # Jumping to the end still emits finished; drop the frames
+                # counted so far so the truncated run isn't timed
+                self._frame_count = 0
+                self._animation_group.setCurrentTime(self._animation_group.duration())
+            self._snap_animation.stop()
+            self._drag_timer.stop()
+            self._fullscreen_timer.setInterval(
+                max(self._fullscreen_poll_interval(), config.FULLSCREEN_SUSPENDED_INTERVAL)
+            )
         else:
+            self._fullscreen_timer.setInterval(self._fullscreen_poll_interval())
             # Show overlay when exiting fullscreen
             if not self.isVisible() and not self._is_hidden:
                 self.show()
@@ -601,13 +886,21 @@ class OverlayMainWindow(QMainWindow):
         super().resizeEvent(event)
         # Reposition widgets if needed
     
+    def changeEvent(self, event):
+        """Drop the cached theme when the system palette changes."""
+        if event.type() == QEvent.Type.ApplicationPaletteChange:
+            ThemeManager.invalidate()
+            self.button.update()
+        super().changeEvent(event)
+    
     def closeEvent(self, event):
         """Handle window close event."""
         # Instead of closing, just hide to system tray
-        if self.tray_icon.isVisible():
+        if self.tray_icon is not None and self.tray_icon.isVisible():
             event.ignore()
             self.hide()
-            self.notes_window.hide()
+            if self.notes_window is not None:
+                self.notes_window.hide()
             self.tray_icon.showMessage(
                 "Notes Overlay",
                 "Application minimized to tray. Right-click the tray icon to exit.",
@@ -616,13 +909,13 @@ class OverlayMainWindow(QMainWindow):
             )
         else:
             # If tray icon is not visible, allow close
-            content = self.notes_window.get_content()
-            self._notes_manager.save_notes(content)
+            self._save_notes_now()
+            self._settings.sync()
             event.accept()
     
     def _toggle_manual_visibility(self):
         """Hide or show the overlay via keyboard shortcut."""
-        print("DEBUG: Ctrl+Alt+N shortcut triggered!")  # Debug line
+        logger.debug("Ctrl+Alt+N shortcut triggered")
         if self._is_hidden:
             self._is_hidden = False
             self.button.show()
@@ -631,18 +924,26 @@ class OverlayMainWindow(QMainWindow):
             if not self.isVisible():
                 self.show()
             self._position_widgets()
+            # Resume fullscreen polling (keeps the interval last set for it)
+            self._fullscreen_timer.start()
         else:
             self._is_hidden = True
             if self._is_expanded:
                 self._collapse()
-            self.notes_window.hide()
+            if self.notes_window is not None:
+                self.notes_window.hide()
             self.button.hide()
             self.setWindowOpacity(0.0)
             self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+            # Nothing to show or hide while manually hidden, so stop polling
+            self._fullscreen_timer.stop()
 
 
 def main():
     """Application entry point."""
+    # DEBUG records (e.g. per-shortcut traces) are skipped without formatting
+    logging.basicConfig(level=logging.INFO)
+    
     app = QApplication(sys.argv)
     app.setApplicationName(config.APP_NAME)
     
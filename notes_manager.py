@@ -2,10 +2,14 @@
 Manages saving and loading notes from persistent storage.
 """
 import json
+import logging
+import os
 from pathlib import Path
 from typing import Optional
 import config
 
+logger = logging.getLogger(__name__)
+
 
 class NotesManager:
     """Handles note persistence using JSON storage."""
@@ -23,19 +27,29 @@ class NotesManager:
                     data = json.load(f)
                     self._notes = data.get('content', '')
         except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading notes: {e}")
+            logger.error("Error loading notes: %s", e)
             self._notes = ""
     
     def save_notes(self, content: str) -> bool:
-        """Save notes to file."""
+        """
+        Save notes to file.
+        Writes to a temporary file and swaps it in, so a crash or a
+        background save interrupted at exit never leaves a truncated file.
+        """
+        # Nothing changed since the last load/save; skip the write entirely
+        if content == self._notes:
+            return True
         try:
-            self._notes = content
             data = {'content': content}
-            with open(self.notes_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            tmp_file = self.notes_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                # Compact output; the payload is one string so indenting buys nothing
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_file, self.notes_file)
+            self._notes = content
             return True
         except IOError as e:
-            print(f"Error saving notes: {e}")
+            logger.error("Error saving notes: %s", e)
             return False
     
     def get_notes(self) -> str:
@@ -2,27 +2,199 @@
 Notes window with Windows 11 styling, tabs, and auto-save functionality.
 """
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, 
     QPushButton, QTabWidget, QMessageBox, QTabBar, QMenu, QInputDialog
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRectF, QPropertyAnimation, QEasingCurve, QEvent
-from PyQt6.QtGui import QFont, QPainter, QPainterPath, QColor, QBrush, QKeyEvent, QTextCursor
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRectF, QEvent, QSignalBlocker
+from PyQt6.QtGui import QFont, QPainter, QColor, QBrush, QKeyEvent, QTextCursor
+import json
+from functools import partial
 import config
 from theme_manager import ThemeManager
 import re
 
 
+# Stylesheets are built once at import from one template per widget and a
+# palette per theme, then picked by theme (keyed by is_dark)
+_DARK_PALETTE = {
+    "pane_border": "rgba(100, 100, 100, 150)",
+    "pane_bg": "rgba(32, 32, 32, 240)",
+    "tab_bg": "rgba(50, 50, 50, 200)",
+    "tab_text": "rgba(255, 255, 255, 200)",
+    "tab_border": "rgba(80, 80, 80, 150)",
+    "text": "rgb(255, 255, 255)",
+    "tab_hover": "rgba(70, 70, 70, 220)",
+    "scroll_bg": "rgba(40, 40, 40, 200)",
+    "handle": "rgba(100, 100, 100, 200)",
+    "handle_hover": "rgba(130, 130, 130, 200)",
+    "close_text": "#bdc3c7",
+}
+
+_LIGHT_PALETTE = {
+    "pane_border": "rgba(200, 200, 200, 150)",
+    "pane_bg": "rgba(245, 245, 245, 240)",
+    "tab_bg": "rgba(230, 230, 230, 200)",
+    "tab_text": "rgba(0, 0, 0, 200)",
+    "tab_border": "rgba(200, 200, 200, 150)",
+    "text": "rgb(0, 0, 0)",
+    "tab_hover": "rgba(220, 220, 220, 220)",
+    "scroll_bg": "rgba(240, 240, 240, 200)",
+    "handle": "rgba(180, 180, 180, 200)",
+    "handle_hover": "rgba(150, 150, 150, 200)",
+    "close_text": "#7f8c8d",
+}
+
+_TAB_STYLE_TEMPLATE = """
+QTabWidget::pane {{
+    border: 1px solid {pane_border};
+    border-radius: 8px;
+    background-color: {pane_bg};
+    top: -1px;
+}}
+QTabBar::tab {{
+    background-color: {tab_bg};
+    color: {tab_text};
+    padding: 8px 15px;
+    margin-right: 2px;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+    border: 1px solid {tab_border};
+}}
+QTabBar::tab:selected {{
+    background-color: {pane_bg};
+    color: {text};
+    border-bottom: 1px solid {pane_bg};
+}}
+QTabBar::tab:hover {{
+    background-color: {tab_hover};
+}}
+QTabBar::close-button {{
+    image: none;
+    subcontrol-position: right;
+    margin: 2px;
+}}
+QPlainTextEdit {{
+    background-color: {pane_bg};
+    border: none;
+    border-radius: 8px;
+    padding: 10px;
+    color: {text};
+    selection-background-color: rgba(0, 120, 215, 180);
+    selection-color: rgb(255, 255, 255);
+}}
+QPlainTextEdit:focus {{
+    border: 1px solid rgba(0, 120, 215, 200);
+}}
+QScrollBar:vertical {{
+    background-color: {scroll_bg};
+    width: 12px;
+    border: none;
+    border-radius: 6px;
+    margin: 0;
+}}
+QScrollBar::handle:vertical {{
+    background-color: {handle};
+    border-radius: 6px;
+    min-height: 30px;
+}}
+QScrollBar::handle:vertical:hover {{
+    background-color: {handle_hover};
+}}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+    height: 0px;
+}}
+"""
+
+_TAB_STYLES = {
+    True: _TAB_STYLE_TEMPLATE.format(**_DARK_PALETTE),
+    False: _TAB_STYLE_TEMPLATE.format(**_LIGHT_PALETTE),
+}
+
+_CLOSE_BUTTON_STYLE_TEMPLATE = """
+QPushButton {{
+    background-color: transparent;
+    color: {close_text};
+    border: none;
+    font-size: 16px;
+    font-weight: bold;
+    padding: 0px;
+    margin: 0px;
+}}
+QPushButton:hover {{
+    background-color: #e74c3c;
+    color: white;
+    border-radius: 3px;
+}}
+"""
+
+_CLOSE_BUTTON_STYLES = {
+    True: _CLOSE_BUTTON_STYLE_TEMPLATE.format(**_DARK_PALETTE),
+    False: _CLOSE_BUTTON_STYLE_TEMPLATE.format(**_LIGHT_PALETTE),
+}
+
+_DARK_BUTTON_STYLE = """
+QPushButton {
+    background-color: rgba(60, 60, 60, 200);
+    color: white;
+    border: 1px solid rgba(100, 100, 100, 150);
+    border-radius: 5px;
+    font-weight: bold;
+    font-size: 16px;
+}
+QPushButton:hover {
+    background-color: rgba(80, 80, 80, 220);
+    border: 1px solid rgba(0, 120, 215, 200);
+}
+QPushButton:pressed {
+    background-color: rgba(50, 50, 50, 240);
+}
+"""
+
+_LIGHT_BUTTON_STYLE = """
+QPushButton {
+    background-color: rgba(240, 240, 240, 200);
+    color: black;
+    border: 1px solid rgba(200, 200, 200, 150);
+    border-radius: 5px;
+    font-weight: bold;
+    font-size: 16px;
+}
+QPushButton:hover {
+    background-color: rgba(230, 230, 230, 220);
+    border: 1px solid rgba(0, 120, 215, 200);
+}
+QPushButton:pressed {
+    background-color: rgba(220, 220, 220, 240);
+}
+"""
+
+_BUTTON_STYLES = {True: _DARK_BUTTON_STYLE, False: _LIGHT_BUTTON_STYLE}
+
+# Corner radius of the painted window background
+_CORNER_RADIUS = 12.0
+
+
 class NotesWindow(QWidget):
     """Notepad window with modern Windows 11 styling and tabs support."""
     
-    content_changed = pyqtSignal(str)  # Emitted when content changes
+    content_changed = pyqtSignal()  # Emitted when content changes; pull it with get_all_content()
+    
+    # Editor font shared by every tab; created on first use because a QFont
+    # can't be built before the QApplication exists
+    _editor_font = None
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._save_timer = QTimer()
-        self._save_timer.setSingleShot(True)
-        self._save_timer.timeout.connect(self._on_save_timeout)
         self._plus_tab_index = -1  # Initialize plus tab index
+        self._plus_widget = None  # Page widget of the + tab, located via indexOf
+        # Paint caches: theme colors (reset by refresh_theme)
+        self._bg_brush = None
+        self._border_qcolor = None
+        self._styled_dark = None  # Theme the current stylesheet was built for
+        # System theme, queried once here and again only by refresh_theme
+        self._is_dark = ThemeManager.is_dark_mode()
+        self._theme_refresh_pending = False
+        self._suspend_change = False  # Set while tabs are rebuilt/reordered programmatically
         
         self._setup_ui()
         self._setup_styling()
@@ -47,6 +219,12 @@ class NotesWindow(QWidget):
         self.tab_widget.tabBar().setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tab_widget.tabBar().customContextMenuRequested.connect(self._show_tab_context_menu)
         
+        # Tab context menu, built once and reused for every right-click
+        self._context_tab_index = -1
+        self._tab_menu = QMenu(self)
+        rename_action = self._tab_menu.addAction("Rename")
+        rename_action.triggered.connect(self._rename_context_tab)
+        
         layout.addWidget(self.tab_widget)
         
         # Create initial tab (the + button will be added as a tab)
@@ -55,43 +233,7 @@ class NotesWindow(QWidget):
     
     def _get_button_style(self):
         """Get button style based on theme."""
-        is_dark = ThemeManager.is_dark_mode()
-        if is_dark:
-            return """
-                QPushButton {
-                    background-color: rgba(60, 60, 60, 200);
-                    color: white;
-                    border: 1px solid rgba(100, 100, 100, 150);
-                    border-radius: 5px;
-                    font-weight: bold;
-                    font-size: 16px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(80, 80, 80, 220);
-                    border: 1px solid rgba(0, 120, 215, 200);
-                }
-                QPushButton:pressed {
-                    background-color: rgba(50, 50, 50, 240);
-                }
-            """
-        else:
-            return """
-                QPushButton {
-                    background-color: rgba(240, 240, 240, 200);
-                    color: black;
-                    border: 1px solid rgba(200, 200, 200, 150);
-                    border-radius: 5px;
-                    font-weight: bold;
-                    font-size: 16px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(230, 230, 230, 220);
-                    border: 1px solid rgba(0, 120, 215, 200);
-                }
-                QPushButton:pressed {
-                    background-color: rgba(220, 220, 220, 240);
-                }
-            """
+        return _BUTTON_STYLES[self._is_dark]
     
     def _setup_styling(self):
         """Apply Windows 11 styling with dark mode support."""
@@ -99,145 +241,36 @@ class NotesWindow(QWidget):
         self.setMinimumSize(config.NOTES_WINDOW_MIN_WIDTH, config.NOTES_WINDOW_MIN_HEIGHT)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         
-        # Get theme colors
-        is_dark = ThemeManager.is_dark_mode()
-        
-        if is_dark:
-            # Dark mode stylesheet
-            tab_style = """
-                QTabWidget::pane {
-                    border: 1px solid rgba(100, 100, 100, 150);
-                    border-radius: 8px;
-                    background-color: rgba(32, 32, 32, 240);
-                    top: -1px;
-                }
-                QTabBar::tab {
-                    background-color: rgba(50, 50, 50, 200);
-                    color: rgba(255, 255, 255, 200);
-                    padding: 8px 15px;
-                    margin-right: 2px;
-                    border-top-left-radius: 6px;
-                    border-top-right-radius: 6px;
-                    border: 1px solid rgba(80, 80, 80, 150);
-                }
-                QTabBar::tab:selected {
-                    background-color: rgba(32, 32, 32, 240);
-                    color: rgb(255, 255, 255);
-                    border-bottom: 1px solid rgba(32, 32, 32, 240);
-                }
-                QTabBar::tab:hover {
-                    background-color: rgba(70, 70, 70, 220);
-                }
-                QTabBar::close-button {
-                    image: none;
-                    subcontrol-position: right;
-                    margin: 2px;
-                }
-                QTextEdit {
-                    background-color: rgba(32, 32, 32, 240);
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px;
-                    color: rgb(255, 255, 255);
-                    selection-background-color: rgba(0, 120, 215, 180);
-                    selection-color: rgb(255, 255, 255);
-                }
-                QTextEdit:focus {
-                    border: 1px solid rgba(0, 120, 215, 200);
-                }
-                QScrollBar:vertical {
-                    background-color: rgba(40, 40, 40, 200);
-                    width: 12px;
-                    border: none;
-                    border-radius: 6px;
-                    margin: 0;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: rgba(100, 100, 100, 200);
-                    border-radius: 6px;
-                    min-height: 30px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background-color: rgba(130, 130, 130, 200);
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    height: 0px;
-                }
-            """
-        else:
-            # Light mode stylesheet
-            tab_style = """
-                QTabWidget::pane {
-                    border: 1px solid rgba(200, 200, 200, 150);
-                    border-radius: 8px;
-                    background-color: rgba(245, 245, 245, 240);
-                    top: -1px;
-                }
-                QTabBar::tab {
-                    background-color: rgba(230, 230, 230, 200);
-                    color: rgba(0, 0, 0, 200);
-                    padding: 8px 15px;
-                    margin-right: 2px;
-                    border-top-left-radius: 6px;
-                    border-top-right-radius: 6px;
-                    border: 1px solid rgba(200, 200, 200, 150);
-                }
-                QTabBar::tab:selected {
-                    background-color: rgba(245, 245, 245, 240);
-                    color: rgb(0, 0, 0);
-                    border-bottom: 1px solid rgba(245, 245, 245, 240);
-                }
-                QTabBar::tab:hover {
-                    background-color: rgba(220, 220, 220, 220);
-                }
-                QTabBar::close-button {
-                    image: none;
-                    subcontrol-position: right;
-                    margin: 2px;
-                }
-                QTextEdit {
-                    background-color: rgba(245, 245, 245, 240);
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px;
-                    color: rgb(0, 0, 0);
-                    selection-background-color: rgba(0, 120, 215, 180);
-                    selection-color: rgb(255, 255, 255);
-                }
-                QTextEdit:focus {
-                    border: 1px solid rgba(0, 120, 215, 200);
-                }
-                QScrollBar:vertical {
-                    background-color: rgba(240, 240, 240, 200);
-                    width: 12px;
-                    border: none;
-                    border-radius: 6px;
-                    margin: 0;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: rgba(180, 180, 180, 200);
-                    border-radius: 6px;
-                    min-height: 30px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background-color: rgba(150, 150, 150, 200);
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    height: 0px;
-                }
-            """
-        
-        self.tab_widget.setStyleSheet(tab_style)
+        # Pick the prebuilt stylesheet for the current theme; re-setting an
+        # identical sheet would still re-polish every tab and editor
+        is_dark = self._is_dark
+        if is_dark == self._styled_dark:
+            return
+        self.tab_widget.setStyleSheet(_TAB_STYLES[is_dark])
+        self._styled_dark = is_dark
+        
+        # Close buttons carry their own sheet; restyle those already created
+        tab_bar = self.tab_widget.tabBar()
+        for i in range(tab_bar.count()):
+            close_btn = tab_bar.tabButton(i, QTabBar.ButtonPosition.RightSide)
+            if close_btn is not None:
+                close_btn.setStyleSheet(_CLOSE_BUTTON_STYLES[is_dark])
     
-    def _create_text_editor(self):
-        """Create a new text editor widget."""
-        text_edit = QTextEdit()
-        text_edit.setFont(QFont("Segoe UI", 11))
+    def _create_text_editor(self, content: str = ""):
+        """Create a new text editor widget, optionally preloaded with content."""
+        text_edit = QPlainTextEdit()
+        if NotesWindow._editor_font is None:
+            NotesWindow._editor_font = QFont("Segoe UI", 11)
+        text_edit.setFont(NotesWindow._editor_font)
         text_edit.setPlaceholderText("Start typing your notes...")
-        text_edit.setAcceptRichText(False)
         
-        # Connect text change signal
-        text_edit.textChanged.connect(self._on_text_changed)
+        # Load before connecting so restoring notes isn't reported as an edit
+        if content:
+            text_edit.setPlainText(content)
+        
+        # Connect text change signal; contentsChange reports the edited span,
+        # so notifications with nothing inserted or removed can be skipped
+        text_edit.document().contentsChange.connect(self._on_contents_change)
         
         # Install event filter for automatic numbering
         text_edit.installEventFilter(self)
@@ -245,37 +278,24 @@ class NotesWindow(QWidget):
         return text_edit
     
     def _add_new_tab(self):
-        """Add a new tab with a text editor and animation."""
+        """Add a new tab with a text editor."""
         text_edit = self._create_text_editor()
         
         # Find the next available "Note X" name
         tab_name = self._get_next_available_tab_name()
         
-        # Insert new tab before the + tab (if it exists)
+        # Insert new tab before the + tab (if it exists) in a single tab
+        # mutation; the + tab keeps its position and empty close button
         if self._plus_tab_index >= 0:
-            # Remove the + tab temporarily
-            plus_widget = self.tab_widget.widget(self._plus_tab_index)
-            self.tab_widget.removeTab(self._plus_tab_index)
-            
-            # Add the new note tab
-            new_index = self.tab_widget.addTab(text_edit, tab_name)
-            
-            # Re-add the + tab at the end
-            self._plus_tab_index = self.tab_widget.addTab(plus_widget, "+")
-            
-            # Make sure + tab has no close button
-            self.tab_widget.tabBar().setTabButton(
-                self._plus_tab_index,
-                QTabBar.ButtonPosition.RightSide,
-                None
-            )
+            new_index = self.tab_widget.insertTab(self._plus_tab_index, text_edit, tab_name)
+            self._plus_tab_index += 1
         else:
             # First tab - no + tab exists yet
             new_index = self.tab_widget.addTab(text_edit, tab_name)
         
         # Create custom close button
         close_btn = self._create_close_button()
-        close_btn.clicked.connect(lambda checked=False, idx=new_index: self._close_tab_by_button(idx))
+        close_btn.clicked.connect(partial(self._close_tab_by_widget, text_edit))
         
         self.tab_widget.tabBar().setTabButton(
             new_index,
@@ -283,101 +303,42 @@ class NotesWindow(QWidget):
             close_btn
         )
         
-        # Switch to new tab with animation
+        # Switch to new tab
         self.tab_widget.setCurrentIndex(new_index)
-        
-        # Animate the new tab (fade in effect on the text editor)
-        text_edit.setStyleSheet("QTextEdit { opacity: 0; }")
-        animation = QPropertyAnimation(text_edit, b"windowOpacity")
-        animation.setDuration(300)
-        animation.setStartValue(0.0)
-        animation.setEndValue(1.0)
-        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        # Reset stylesheet after animation
-        def reset_style():
-            text_edit.setStyleSheet("")
-            self._setup_styling()
-        
-        animation.finished.connect(reset_style)
-        animation.start()
-        
-        # Store animation to prevent garbage collection
-        self._last_animation = animation
     
     def _get_next_available_tab_name(self):
         """Find the next available 'Note X' name that doesn't exist."""
-        # Collect all existing tab names (excluding + tab)
-        existing_names = []
+        # Collect the numbers already used by "Note N" tabs (excluding + tab)
+        used_numbers = set()
         for i in range(self.tab_widget.count()):
             if self._plus_tab_index >= 0 and i == self._plus_tab_index:
                 continue
             tab_name = self.tab_widget.tabText(i)
-            # Only collect names, not empty strings
-            if tab_name and tab_name != "+":
-                existing_names.append(tab_name)
+            if tab_name.startswith("Note "):
+                try:
+                    used_numbers.add(int(tab_name[5:]))
+                except ValueError:
+                    pass
         
-        # Try Note 1, Note 2, Note 3, etc. until we find one that doesn't exist
+        # Smallest free number, so Note 1, Note 2, ... fill gaps first
         counter = 1
-        while counter < 1000:  # Safety limit to prevent infinite loop
-            candidate_name = f"Note {counter}"
-            if candidate_name not in existing_names:
-                return candidate_name
+        while counter in used_numbers:
             counter += 1
-        
-        # Fallback (should never reach here)
-        return f"Note {len(existing_names) + 1}"
+        return f"Note {counter}"
     
     def _create_close_button(self):
         """Create a custom close button for tabs."""
         close_btn = QPushButton("×")
         close_btn.setFixedSize(18, 18)
-        
-        is_dark = ThemeManager.is_dark_mode()
-        if is_dark:
-            close_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #bdc3c7;
-                    border: none;
-                    font-size: 16px;
-                    font-weight: bold;
-                    padding: 0px;
-                    margin: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #e74c3c;
-                    color: white;
-                    border-radius: 3px;
-                }
-            """)
-        else:
-            close_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #7f8c8d;
-                    border: none;
-                    font-size: 16px;
-                    font-weight: bold;
-                    padding: 0px;
-                    margin: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #e74c3c;
-                    color: white;
-                    border-radius: 3px;
-                }
-            """)
+        close_btn.setStyleSheet(_CLOSE_BUTTON_STYLES[self._is_dark])
         return close_btn
     
-    def _close_tab_by_button(self, index):
-        """Close tab when close button is clicked."""
-        # Get current index because tabs might have shifted
-        for i in range(self.tab_widget.count()):
-            btn = self.tab_widget.tabBar().tabButton(i, QTabBar.ButtonPosition.RightSide)
-            if btn == self.sender():
-                self._close_tab(i)
-                return
+    def _close_tab_by_widget(self, widget, checked=False):
+        """Close the tab holding widget when its close button is clicked."""
+        # Look the index up at click time because tabs might have shifted
+        index = self.tab_widget.indexOf(widget)
+        if index >= 0:
+            self._close_tab(index)
     
     def _close_tab(self, index):
         """Close a tab with confirmation dialog."""
@@ -400,7 +361,7 @@ class NotesWindow(QWidget):
         text_edit = self.tab_widget.widget(index)
         
         # Check if tab has content
-        if text_edit and isinstance(text_edit, QTextEdit) and text_edit.toPlainText().strip():
+        if text_edit and isinstance(text_edit, QPlainTextEdit) and text_edit.toPlainText().strip():
             # Show confirmation dialog
             reply = QMessageBox.question(
                 self,
@@ -416,45 +377,18 @@ class NotesWindow(QWidget):
         # Store the current tab index before removal
         current_index = self.tab_widget.currentIndex()
         
-        # Animate tab close (fade out)
-        if text_edit and isinstance(text_edit, QTextEdit):
-            animation = QPropertyAnimation(text_edit, b"windowOpacity")
-            animation.setDuration(200)
-            animation.setStartValue(1.0)
-            animation.setEndValue(0.0)
-            animation.setEasingCurve(QEasingCurve.Type.InCubic)
-            
-            # Remove tab after animation
-            def remove_tab():
-                self.tab_widget.removeTab(index)
-                # Update plus tab index - find it again
-                for i in range(self.tab_widget.count()):
-                    if self.tab_widget.tabText(i) == "+":
-                        self._plus_tab_index = i
-                        break
-                
-                # Switch to a valid tab if we deleted the current one
-                if current_index == index and self.tab_widget.count() > 1:
-                    # Go to previous tab or first tab
-                    new_current = max(0, min(index - 1, self.tab_widget.count() - 2))
-                    self.tab_widget.setCurrentIndex(new_current)
-                
-                self._on_text_changed()
-            
-            animation.finished.connect(remove_tab)
-            animation.start()
-            
-            # Store animation to prevent garbage collection
-            self._last_animation = animation
-        else:
-            # If no animation needed, remove directly
-            self.tab_widget.removeTab(index)
-            # Update plus tab index
-            for i in range(self.tab_widget.count()):
-                if self.tab_widget.tabText(i) == "+":
-                    self._plus_tab_index = i
-                    break
-            self._on_text_changed()
+        # Remove the tab
+        self.tab_widget.removeTab(index)
+        # Update plus tab index
+        self._plus_tab_index = self.tab_widget.indexOf(self._plus_widget)
+        
+        # Switch to a valid tab if we deleted the current one
+        if current_index == index and self.tab_widget.count() > 1:
+            # Go to previous tab or first tab
+            new_current = max(0, min(index - 1, self.tab_widget.count() - 2))
+            self.tab_widget.setCurrentIndex(new_current)
+        
+        self._on_text_changed()
     
     def _add_plus_tab(self):
         """Add a permanent '+' tab at the end."""
@@ -469,8 +403,9 @@ class NotesWindow(QWidget):
             None
         )
         
-        # Store the plus tab index
+        # Store the plus tab index and page
         self._plus_tab_index = plus_index
+        self._plus_widget = plus_widget
     
     def _show_tab_context_menu(self, position):
         """Show context menu when right-clicking on a tab."""
@@ -481,15 +416,15 @@ class NotesWindow(QWidget):
         if tab_index < 0 or (self._plus_tab_index >= 0 and tab_index == self._plus_tab_index):
             return
         
-        # Create context menu
-        menu = QMenu(self)
-        
-        # Add "Rename" action
-        rename_action = menu.addAction("Rename")
-        rename_action.triggered.connect(lambda: self._rename_tab(tab_index))
+        # Remember which tab the menu is for
+        self._context_tab_index = tab_index
         
         # Show the menu at the cursor position
-        menu.exec(self.tab_widget.tabBar().mapToGlobal(position))
+        self._tab_menu.exec(self.tab_widget.tabBar().mapToGlobal(position))
+    
+    def _rename_context_tab(self):
+        """Rename the tab the context menu was opened on."""
+        self._rename_tab(self._context_tab_index)
     
     def _rename_tab(self, index):
         """Rename a tab."""
@@ -518,76 +453,67 @@ class NotesWindow(QWidget):
     
     def _on_tab_moved(self, from_index, to_index):
         """Handle tab being moved/dragged."""
-        # Update the plus tab index after a tab is moved
-        # Find which tab is the + tab
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabText(i) == "+":
-                widget = self.tab_widget.widget(i)
-                if widget and not isinstance(widget, QTextEdit):
-                    self._plus_tab_index = i
-                    break
-        
-        # If + tab is not at the end, move it there
-        if self._plus_tab_index >= 0 and self._plus_tab_index != self.tab_widget.count() - 1:
-            # Block signals to prevent recursion
-            self.tab_widget.tabBar().blockSignals(True)
-            
-            # Get the + widget
-            plus_widget = self.tab_widget.widget(self._plus_tab_index)
-            
-            # Remove it
-            self.tab_widget.removeTab(self._plus_tab_index)
-            
-            # Add it back at the end
-            self._plus_tab_index = self.tab_widget.addTab(plus_widget, "+")
+        # Moving the + tab back may fire tab/focus notifications; report the
+        # reorder once at the end instead
+        self._suspend_change = True
+        try:
+            # Update the plus tab index after a tab is moved; looking the page
+            # up by identity also ignores note tabs renamed to "+"
+            self._plus_tab_index = self.tab_widget.indexOf(self._plus_widget)
+        
+            # If + tab is not at the end, move it there
+            if self._plus_tab_index >= 0 and self._plus_tab_index != self.tab_widget.count() - 1:
+                # Block signals to prevent recursion (unblocked even if this raises)
+                with QSignalBlocker(self.tab_widget.tabBar()):
+                    # Remove it
+                    self.tab_widget.removeTab(self._plus_tab_index)
             
-            # Make sure + tab has no close button
-            self.tab_widget.tabBar().setTabButton(
-                self._plus_tab_index,
-                QTabBar.ButtonPosition.RightSide,
-                None
-            )
+                    # Add it back at the end
+                    self._plus_tab_index = self.tab_widget.addTab(self._plus_widget, "+")
             
-            # Unblock signals
-            self.tab_widget.tabBar().blockSignals(False)
+                    # Make sure + tab has no close button
+                    self.tab_widget.tabBar().setTabButton(
+                        self._plus_tab_index,
+                        QTabBar.ButtonPosition.RightSide,
+                        None
+                    )
+        finally:
+            self._suspend_change = False
+        
+        # The new tab order is part of the saved notes
+        self._on_text_changed()
     
     def _on_tab_changed(self, index):
         """Handle tab change."""
         # Check if user clicked on the + tab
         if self._plus_tab_index >= 0 and index == self._plus_tab_index:
             # Block signals temporarily
-            self.tab_widget.blockSignals(True)
-            
-            # Switch back to the previous tab
-            if self.tab_widget.count() > 1:
-                # Go to the tab before the + tab
-                self.tab_widget.setCurrentIndex(self._plus_tab_index - 1)
-            
-            # Unblock signals
-            self.tab_widget.blockSignals(False)
+            with QSignalBlocker(self.tab_widget):
+                # Switch back to the previous tab
+                if self.tab_widget.count() > 1:
+                    # Go to the tab before the + tab
+                    self.tab_widget.setCurrentIndex(self._plus_tab_index - 1)
             
             # Add new tab
             self._add_new_tab()
         elif index >= 0:
             self._on_text_changed()
     
-    def _on_text_changed(self):
-        """Handle text change with debouncing for auto-save."""
-        content = self.get_all_content()
-        self.content_changed.emit(content)
-        
-        # Debounce save operation (save after 1 second of no typing)
-        self._save_timer.stop()
-        self._save_timer.start(1000)
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Forward real edits from an editor's document."""
+        if chars_removed or chars_added:
+            self._on_text_changed()
     
-    def _on_save_timeout(self):
-        """Called when save timer expires."""
-        # This will be handled by the main application
-        pass
+    def _on_text_changed(self):
+        """Notify listeners that notes changed; they debounce and pull content."""
+        if self._suspend_change:
+            return
+        # No payload: serializing every tab here would cost O(notes) per keystroke
+        self.content_changed.emit()
     
     def eventFilter(self, obj, event):
         """Event filter for automatic numbering."""
-        if isinstance(obj, QTextEdit) and event.type() == QEvent.Type.KeyPress:
+        if isinstance(obj, QPlainTextEdit) and event.type() == QEvent.Type.KeyPress:
             key_event = event
             
             # Handle Enter key press
@@ -657,110 +583,137 @@ class NotesWindow(QWidget):
     def get_content(self) -> str:
         """Get content from current tab (for compatibility)."""
         current_widget = self.tab_widget.currentWidget()
-        if current_widget and isinstance(current_widget, QTextEdit):
+        if current_widget and isinstance(current_widget, QPlainTextEdit):
             return current_widget.toPlainText()
         return ""
     
     def get_all_content(self) -> str:
         """Get content from all tabs as a serialized string."""
-        import json
-        
         tabs_data = []
         for i in range(self.tab_widget.count()):
             # Skip the + tab
-            if self._plus_tab_index >= 0 and i == self._plus_tab_index:
+            if i == self._plus_tab_index:
                 continue
-                
-            text_edit = self.tab_widget.widget(i)
-            tab_name = self.tab_widget.tabText(i)
             
-            if text_edit and isinstance(text_edit, QTextEdit):
+            text_edit = self.tab_widget.widget(i)
+            if isinstance(text_edit, QPlainTextEdit):
                 tabs_data.append({
-                    "name": tab_name,
+                    "name": self.tab_widget.tabText(i),
                     "content": text_edit.toPlainText()
                 })
         
-        return json.dumps(tabs_data)
+        # Compact, non-escaped JSON: the string is only ever read back by set_content
+        return json.dumps(tabs_data, ensure_ascii=False, separators=(",", ":"))
     
     def set_content(self, content: str):
         """Set content from serialized string (restores all tabs)."""
-        import json
-        
-        # Block signals during loading
-        self.tab_widget.blockSignals(True)
-        
-        try:
-            tabs_data = json.loads(content)
+        # Block signals and repaints during loading; the rebuilt tabs are
+        # painted once at the end
+        self.setUpdatesEnabled(False)
+        self._suspend_change = True
+        with QSignalBlocker(self.tab_widget):
+            try:
+                tabs_data = json.loads(content)
             
-            # Clear existing tabs
-            while self.tab_widget.count() > 0:
-                self.tab_widget.removeTab(0)
+                # Clear existing tabs
+                self.tab_widget.clear()
             
-            # Reset plus tab index
-            self._plus_tab_index = -1
+                # Reset plus tab index
+                self._plus_tab_index = -1
             
-            # Restore tabs
-            if tabs_data:
-                for tab_data in tabs_data:
-                    text_edit = self._create_text_editor()
-                    text_edit.blockSignals(True)
-                    text_edit.setPlainText(tab_data.get("content", ""))
-                    text_edit.blockSignals(False)
+                # Restore tabs
+                if tabs_data:
+                    for tab_data in tabs_data:
+                        text_edit = self._create_text_editor(tab_data.get("content", ""))
                     
-                    index = self.tab_widget.addTab(text_edit, tab_data.get("name", "Note"))
+                        index = self.tab_widget.addTab(text_edit, tab_data.get("name", "Note"))
                     
-                    # Add close button
-                    close_btn = self._create_close_button()
-                    close_btn.clicked.connect(lambda checked=False, idx=index: self._close_tab_by_button(idx))
+                        # Add close button
+                        close_btn = self._create_close_button()
+                        close_btn.clicked.connect(partial(self._close_tab_by_widget, text_edit))
                     
-                    self.tab_widget.tabBar().setTabButton(
-                        index,
-                        QTabBar.ButtonPosition.RightSide,
-                        close_btn
-                    )
+                        self.tab_widget.tabBar().setTabButton(
+                            index,
+                            QTabBar.ButtonPosition.RightSide,
+                            close_btn
+                        )
                 
-                # Add the + tab at the end
-                self._add_plus_tab()
-            else:
-                # If no tabs, create a default one
-                self._add_new_tab()
-                self._add_plus_tab()
+                    # Add the + tab at the end
+                    self._add_plus_tab()
+                else:
+                    # If no tabs, create a default one
+                    self._add_new_tab()
+                    self._add_plus_tab()
                 
-        except (json.JSONDecodeError, TypeError):
-            # If content is not JSON (old format), treat as single tab
-            while self.tab_widget.count() > 0:
-                self.tab_widget.removeTab(0)
+            except (json.JSONDecodeError, TypeError):
+                # If content is not JSON (old format), treat as single tab
+                self.tab_widget.clear()
             
-            self._plus_tab_index = -1
+                self._plus_tab_index = -1
             
-            text_edit = self._create_text_editor()
-            text_edit.blockSignals(True)
-            text_edit.setPlainText(content)
-            text_edit.blockSignals(False)
+                text_edit = self._create_text_editor(content)
             
-            index = self.tab_widget.addTab(text_edit, "Note 1")
+                index = self.tab_widget.addTab(text_edit, "Note 1")
             
-            close_btn = self._create_close_button()
-            close_btn.clicked.connect(lambda checked=False, idx=index: self._close_tab_by_button(idx))
+                close_btn = self._create_close_button()
+                close_btn.clicked.connect(partial(self._close_tab_by_widget, text_edit))
             
-            self.tab_widget.tabBar().setTabButton(
-                0,
-                QTabBar.ButtonPosition.RightSide,
-                close_btn
-            )
+                self.tab_widget.tabBar().setTabButton(
+                    0,
+                    QTabBar.ButtonPosition.RightSide,
+                    close_btn
+                )
             
-            # Add the + tab
-            self._add_plus_tab()
+                # Add the + tab
+                self._add_plus_tab()
         
-        finally:
-            self.tab_widget.blockSignals(False)
+            finally:
+                self._suspend_change = False
+                self.setUpdatesEnabled(True)
+    
+    def schedule_theme_refresh(self, *args):
+        """Coalesce a burst of theme notifications into one refresh_theme()."""
+        if self._theme_refresh_pending:
+            return
+        self._theme_refresh_pending = True
+        # Next event loop turn, after the palette has settled
+        QTimer.singleShot(0, self._run_theme_refresh)
+    
+    def _run_theme_refresh(self):
+        """Run the refresh requested by schedule_theme_refresh."""
+        self._theme_refresh_pending = False
+        self.refresh_theme()
+    
+    def refresh_theme(self):
+        """Re-apply styling and repaint after a system theme change."""
+        ThemeManager.invalidate()
+        self._is_dark = ThemeManager.is_dark_mode()
+        self._bg_brush = None
+        self._border_qcolor = None
+        self._setup_styling()
+        self.update()
     
     def paintEvent(self, event):
         """Paint the window with rounded corners and blur effect."""
+        # Theme colors are resolved once, not on every repaint
+        if self._bg_brush is None:
+            self._bg_brush = QBrush(ThemeManager.get_bg_qcolor())
+            self._border_qcolor = ThemeManager.get_border_qcolor(1.0)
+        
+        # Drawn with drawRoundedRect, which skips building and rasterizing
+        # a generic path (as the overlay button does)
+        rect = QRectF(self.rect())
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Create rounded rectangle path
-        path = QPainterPath()
-        rect = QRectF(self.rect())
-        radius = 12.0
\ No newline at end of file
+        # Background fill
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bg_brush)
+        painter.drawRoundedRect(rect, _CORNER_RADIUS, _CORNER_RADIUS)
+        
+        # Border
+        painter.setPen(self._border_qcolor)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(rect, _CORNER_RADIUS, _CORNER_RADIUS)
+        painter.end()
@@ -2,12 +2,22 @@
 Custom asymmetric button widget with Windows 11 styling.
 """
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QPoint, QRect, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal
-from PyQt6.QtGui import QPainter, QPainterPath, QColor, QPen, QBrush, QFont, QFontMetrics
+from PyQt6.QtCore import Qt, QPoint, QRect, QRectF, QVariantAnimation, QEasingCurve, pyqtSignal
+from PyQt6.QtGui import (
+    QPainter, QColor, QPen, QFont, QFontMetrics, QPixmap,
+    QStaticText, QTransform
+)
 import config
 from theme_manager import ThemeManager
 
 
+# Radius for rounded corners
+_CORNER_RADIUS = 12.0
+
+# Fill of the offset drop shadow under the button
+_SHADOW_COLOR = QColor(0, 0, 0, 40)
+
+
 class OverlayButton(QWidget):
     """Signal emitted when button is clicked."""
     clicked = pyqtSignal()
@@ -21,37 +31,71 @@ class OverlayButton(QWidget):
     - Windows 11 acrylic blur effect
     """
     
+    # Rendered button images keyed by (is_dark, hovered, opacity, width,
+    # height, device pixel ratio); a hover animation only walks a handful
+    # of rounded opacities, so repaints become a single pixmap blit
+    _chrome_cache = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._hover_opacity = config.BUTTON_OPACITY
         self._is_hovered = False
         self._is_pressed = False
         self._dragging = False
-        self._press_global_pos = None
+        self._press_global_y = None  # Global Y of the press; the drag threshold only uses Y
         
         # Set widget properties
         self.setFixedSize(config.BUTTON_WIDTH, config.BUTTON_HEIGHT)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
         
+        # Vertical "NOTES" label, laid out once for the fixed button size
+        self._font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        self._letters = self._layout_letters()
+        
+        # Rounded rectangle shared by the shadow, fill and borders; drawn with
+        # drawRoundedRect, which skips building and rasterizing a generic path
+        self._rect = QRectF(0.0, 0.0, float(self.width()), float(self.height()))
+        
         # Enable mouse tracking for hover effects
         self.setMouseTracking(True)
         
-        # Setup hover animation
-        self._hover_animation = QPropertyAnimation(self, b"hoverOpacity")
+        # Setup hover animation; ticks call set_hover_opacity directly rather
+        # than going through a Qt property
+        self._hover_animation = QVariantAnimation(self)
         self._hover_animation.setDuration(200)
         self._hover_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._hover_animation.valueChanged.connect(self.set_hover_opacity)
+        
+    def _layout_letters(self) -> list:
+        """Build (x, y, QStaticText) for each letter of the vertical label."""
+        metrics = QFontMetrics(self._font)
+        letters = "NOTES"
+        letter_height = self.height() / (len(letters) + 1)
         
+        laid_out = []
+        for i, letter in enumerate(letters):
+            static_text = QStaticText(letter)
+            static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            static_text.prepare(QTransform(), self._font)
+            x = int((self.width() - metrics.horizontalAdvance(letter)) / 2)
+            # drawStaticText takes the top-left corner, not the baseline
+            y = int(letter_height * (i + 1)) - metrics.ascent()
+            laid_out.append((x, y, static_text))
+        return laid_out
+    
     def get_hover_opacity(self) -> float:
         """Get current hover opacity."""
         return self._hover_opacity
     
     def set_hover_opacity(self, opacity: float) -> None:
         """Set hover opacity and trigger repaint."""
+        # paintEvent renders the opacity rounded to 0.01, so ticks that
+        # don't cross a step would repaint an identical image
+        repaint = round(opacity, 2) != round(self._hover_opacity, 2)
         self._hover_opacity = opacity
-        self.update()
-    
-    hoverOpacity = pyqtProperty(float, get_hover_opacity, set_hover_opacity)
+        if repaint:
+            self.update()
     
     def enterEvent(self, event):
         """Handle mouse enter event."""
@@ -77,21 +121,20 @@ class OverlayButton(QWidget):
         if event.button() == Qt.MouseButton.LeftButton:
             self._is_pressed = True
             self._dragging = False
-            self._press_global_pos = event.globalPosition()
-            self.update()
+            self._press_global_y = event.globalPosition().y()
         super().mousePressEvent(event)
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for drag support."""
         if event.buttons() & Qt.MouseButton.LeftButton:
-            if self._press_global_pos is None:
-                self._press_global_pos = event.globalPosition()
-            delta_y = abs(event.globalPosition().y() - self._press_global_pos.y())
-            if not self._dragging and delta_y >= 5:
+            global_y = event.globalPosition().y()
+            if self._press_global_y is None:
+                self._press_global_y = global_y
+            if not self._dragging and abs(global_y - self._press_global_y) >= 5:
                 self._dragging = True
-                self.dragStarted.emit(self._press_global_pos.y())
+                self.dragStarted.emit(self._press_global_y)
             if self._dragging:
-                self.dragMoved.emit(event.globalPosition().y())
+                self.dragMoved.emit(global_y)
         super().mouseMoveEvent(event)
     
     def mouseReleaseEvent(self, event):
@@ -103,75 +146,72 @@ class OverlayButton(QWidget):
                 self.dragEnded.emit()
             elif self.rect().contains(event.pos()):
                 self.clicked.emit()
-            self._press_global_pos = None
-            self.update()
+            self._press_global_y = None
         super().mouseReleaseEvent(event)
     
     def paintEvent(self, event):
-        """Custom paint event to draw the asymmetric button (half rounded square/pill shape)."""
+        """Custom paint event: blit the pre-rendered button for the current state."""
+        width = self.width()
+        height = self.height()
+        dpr = self.devicePixelRatioF()
+        # Opacity is rounded so the few steps of a hover animation share entries
+        opacity = round(self._hover_opacity, 2)
+        key = (ThemeManager.is_dark_mode(), self._is_hovered, opacity, width, height, dpr)
+        
+        pixmap = OverlayButton._chrome_cache.get(key)
+        if pixmap is None:
+            pixmap = OverlayButton._chrome_cache[key] = self._render_chrome(
+                width, height, dpr, opacity, self._is_hovered
+            )
+        
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+    
+    def _render_chrome(self, width: int, height: int, dpr: float, opacity: float, hovered: bool) -> QPixmap:
+        """Draw the asymmetric button (half rounded square/pill shape) into a new pixmap."""
+        pixmap = QPixmap(round(width * dpr), round(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        width = self.width()
-        height = self.height()
-        corner_radius = 12  # Radius for rounded corners
+        rect = self._rect
         
-        # Create rounded rectangle path
-        path = QPainterPath()
-        path.addRoundedRect(0.0, 0.0, float(width), float(height), float(corner_radius), float(corner_radius))
+        # Fills first, outlines second, so pen and brush each change once
+        # per group instead of being reset before every pass
+        painter.setPen(Qt.PenStyle.NoPen)
         
         # Draw shadow (uniform)
         if config.BUTTON_SHADOW_OFFSET:
-            shadow_color = QColor(0, 0, 0, 40)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(shadow_color))
+            painter.setBrush(_SHADOW_COLOR)
             shadow_offset = config.BUTTON_SHADOW_OFFSET
             painter.translate(0, shadow_offset)
-            painter.drawPath(path)
+            painter.drawRoundedRect(rect, _CORNER_RADIUS, _CORNER_RADIUS)
             painter.translate(0, -shadow_offset)
         
-        # Determine background color based on system theme
-        bg_color_tuple = ThemeManager.get_bg_color()
-        bg_color = QColor(*bg_color_tuple)
-        bg_color.setAlpha(int(255 * self._hover_opacity))
+        # Draw main background (colors are shared QColors per opacity)
+        painter.setBrush(ThemeManager.get_bg_qcolor(opacity))
+        painter.drawRoundedRect(rect, _CORNER_RADIUS, _CORNER_RADIUS)
         
-        # Draw main background first
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(bg_color))
-        painter.drawPath(path)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
         
         # Add glow effect on hover (draw as border/outline)
-        if self._is_hovered:
-            glow_color = QColor(*config.COLOR_HOVER_GLOW)
-            glow_color.setAlpha(int(150 * self._hover_opacity))
-            painter.setPen(QPen(glow_color, 2))
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawPath(path)
+        if hovered:
+            painter.setPen(QPen(ThemeManager.get_glow_qcolor(opacity), 2))
+            painter.drawRoundedRect(rect, _CORNER_RADIUS, _CORNER_RADIUS)
         
         # Draw border (subtle, theme-aware)
-        border_color_tuple = ThemeManager.get_border_color(self._hover_opacity)
-        border_color = QColor(*border_color_tuple)
-        painter.setPen(QPen(border_color, 1))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawPath(path)
+        painter.setPen(QPen(ThemeManager.get_border_qcolor(opacity), 1))
+        painter.drawRoundedRect(rect, _CORNER_RADIUS, _CORNER_RADIUS)
         
         # Draw vertical "NOTES" text (theme-aware)
-        text_color_tuple = ThemeManager.get_text_color()
-        text_color = QColor(*text_color_tuple)
-        text_color.setAlpha(int(255 * self._hover_opacity))
-        painter.setPen(QPen(text_color))
+        painter.setPen(ThemeManager.get_text_qcolor(opacity))
         
-        font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        painter.setFont(font)
+        painter.setFont(self._font)
+        for x, y, static_text in self._letters:
+            painter.drawStaticText(x, y, static_text)
         
-        letters = ["N", "O", "T", "E", "S"]
-        letter_height = height / (len(letters) + 1)
-        start_y = letter_height
-        
-        for i, letter in enumerate(letters):
-            metrics = QFontMetrics(font)
-            letter_width = metrics.horizontalAdvance(letter)
-            x = (width - letter_width) / 2
-            y = start_y + (i * letter_height)
-            painter.drawText(int(x), int(y), letter)
-
+        painter.end()
+        return pixmap
@@ -1,47 +1,120 @@
 """
 Manages theme detection and color schemes for light/dark mode.
 """
+from typing import Optional
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QPalette
+from PyQt6.QtGui import QPalette, QColor
 import config
 
 
+# Per-theme color tables keyed by is_dark, so getters are a single lookup
+_THEME_COLORS = {
+    True: {
+        "bg": config.COLOR_DARK_BG,
+        "text": config.COLOR_DARK_TEXT,
+        "border_rgb": (100, 100, 100),
+    },
+    False: {
+        "bg": config.COLOR_LIGHT_BG,
+        "text": config.COLOR_LIGHT_TEXT,
+        "border_rgb": (220, 220, 220),
+    },
+}
+
+
 class ThemeManager:
     """Manages application theme (light/dark mode)."""
     
+    # Prebuilt QColors keyed by (name, is_dark, opacity); theme colors are
+    # constants, so each combination is only ever built once
+    _qcolor_cache = {}
+    
+    # Last detected theme; None until queried or after invalidate()
+    _dark_mode = None
+    
     @staticmethod
     def is_dark_mode() -> bool:
-        """Detect if system is in dark mode."""
+        """Detect if system is in dark mode (cached until invalidate())."""
+        if ThemeManager._dark_mode is not None:
+            return ThemeManager._dark_mode
         try:
             app = QApplication.instance()
             if app:
                 palette = app.palette()
                 window_color = palette.color(QPalette.ColorRole.Window)
                 # Check if background is dark (lightness < 128)
-                return window_color.lightness() < 128
+                ThemeManager._dark_mode = window_color.lightness() < 128
+                return ThemeManager._dark_mode
         except:
             pass
         # Default to light mode if detection fails
         return False
     
+    @staticmethod
+    def invalidate() -> None:
+        """Forget the cached theme (call when the application palette changes)."""
+        ThemeManager._dark_mode = None
+    
+    @staticmethod
+    def _current_colors() -> dict:
+        """Get the color table of the current theme."""
+        return _THEME_COLORS[ThemeManager.is_dark_mode()]
+    
     @staticmethod
     def get_bg_color() -> tuple:
         """Get background color based on current theme."""
-        if ThemeManager.is_dark_mode():
-            return config.COLOR_DARK_BG
-        return config.COLOR_LIGHT_BG
+        return ThemeManager._current_colors()["bg"]
     
     @staticmethod
     def get_text_color() -> tuple:
         """Get text color based on current theme."""
-        if ThemeManager.is_dark_mode():
-            return config.COLOR_DARK_TEXT
-        return config.COLOR_LIGHT_TEXT
+        return ThemeManager._current_colors()["text"]
     
     @staticmethod
     def get_border_color(opacity: float = 1.0) -> tuple:
         """Get border color based on current theme."""
-        if ThemeManager.is_dark_mode():
-            return (100, 100, 100, int(150 * opacity))
-        return (220, 220, 220, int(150 * opacity))
-
+        return (*ThemeManager._current_colors()["border_rgb"], int(150 * opacity))
+    
+    @staticmethod
+    def _cached_qcolor(key, rgba: tuple) -> QColor:
+        """Get a shared QColor for key, building it from rgba the first time."""
+        color = ThemeManager._qcolor_cache.get(key)
+        if color is None:
+            color = ThemeManager._qcolor_cache[key] = QColor(*rgba)
+        return color
+    
+    @staticmethod
+    def get_bg_qcolor(opacity: Optional[float] = None) -> QColor:
+        """
+        Get background color as a shared QColor (do not modify it).
+        With opacity, alpha is 255 * opacity instead of the theme's own.
+        """
+        is_dark = ThemeManager.is_dark_mode()
+        bg = _THEME_COLORS[is_dark]["bg"]
+        if opacity is not None:
+            bg = (*bg[:3], int(255 * opacity))
+        return ThemeManager._cached_qcolor(("bg", is_dark, opacity), bg)
+    
+    @staticmethod
+    def get_text_qcolor(opacity: float = 1.0) -> QColor:
+        """Get text color with alpha 255 * opacity as a shared QColor (do not modify it)."""
+        is_dark = ThemeManager.is_dark_mode()
+        text = _THEME_COLORS[is_dark]["text"]
+        return ThemeManager._cached_qcolor(
+            ("text", is_dark, opacity), (*text[:3], int(255 * opacity))
+        )
+    
+    @staticmethod
+    def get_glow_qcolor(opacity: float = 1.0) -> QColor:
+        """Get hover glow color with alpha 150 * opacity as a shared QColor (do not modify it)."""
+        return ThemeManager._cached_qcolor(
+            ("glow", None, opacity), (*config.COLOR_HOVER_GLOW[:3], int(150 * opacity))
+        )
+    
+    @staticmethod
+    def get_border_qcolor(opacity: float = 1.0) -> QColor:
+        """Get border color as a shared QColor (do not modify it)."""
+        return ThemeManager._cached_qcolor(
+            ("border", ThemeManager.is_dark_mode(), opacity),
+            ThemeManager.get_border_color(opacity),
+        )